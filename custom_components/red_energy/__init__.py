@@ -12,6 +12,7 @@ from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from .const import (
     CONF_CLIENT_ID,
+    DATA_ENTRIES_BY_USERNAME,
     DATA_SELECTED_ACCOUNTS,
     DOMAIN,
     SERVICE_TYPE_ELECTRICITY,
@@ -107,6 +108,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "device_manager": device_manager,
         "devices": devices,
     }
+    hass.data.setdefault(DATA_ENTRIES_BY_USERNAME, {})[username] = entry.entry_id
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -134,6 +136,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Clean up stored data
         entry_data = hass.data[DOMAIN].pop(entry.entry_id)
 
+        entries_by_username = hass.data.get(DATA_ENTRIES_BY_USERNAME, {})
+        if entries_by_username.get(entry_data["username"]) == entry.entry_id:
+            del entries_by_username[entry_data["username"]]
+
         # Clean up Stage 5 components
         if "state_manager" in entry_data:
             state_manager = entry_data["state_manager"]
@@ -141,16 +147,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         if "device_manager" in entry_data:
             device_manager = entry_data["device_manager"]
-            await device_manager.async_cleanup_orphaned_entities()
+            # Orphan removal isn't needed to finish unloading, so don't block on it.
+            # Not tied to the entry: its background tasks are cancelled on unload.
+            hass.async_create_background_task(
+                device_manager.async_cleanup_orphaned_entities(),
+                f"{DOMAIN}_cleanup_{entry.entry_id}",
+            )
 
-        # Stop coordinator
-        if "coordinator" in entry_data:
-            coordinator = entry_data["coordinator"]
-            # The coordinator will be garbage collected
+        # The coordinator is released with entry_data and garbage collected
 
         # Remove domain data if empty
         if not hass.data[DOMAIN]:
             hass.data.pop(DOMAIN)
+            hass.data.pop(DATA_ENTRIES_BY_USERNAME, None)
             # Unload services when last integration is removed
             await async_unload_services(hass)
 
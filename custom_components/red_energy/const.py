@@ -61,4 +61,6 @@ ERROR_NO_ACCOUNTS: Final = "no_accounts"
 # Data keys
 DATA_ACCOUNTS: Final = "accounts"
 DATA_SELECTED_ACCOUNTS: Final = "selected_accounts"
-DATA_CUSTOMER_DATA: Final = "customer_data"
\ No newline at end of file
+DATA_CUSTOMER_DATA: Final = "customer_data"
+# hass.data key of the username -> config entry ID index used by services
+DATA_ENTRIES_BY_USERNAME: Final = f"{DOMAIN}_entries_by_username"
@@ -49,6 +49,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         self.password = password
         self.client_id = client_id
         self.selected_accounts = selected_accounts
+        self._selected_accounts_set = frozenset(selected_accounts)
 
         # Initialize Stage 5 enhancements
         self._error_recovery = RedEnergyErrorRecoverySystem(hass)
@@ -56,6 +57,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         self._data_processor = DataProcessor(self._performance_monitor)
         self.update_failures = 0
         self.services = services
+        self._services_set = frozenset(services)
 
         # Initialize API client
         session = async_get_clientsession(hass)
@@ -64,14 +66,71 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
 
         self._customer_data: Optional[Dict[str, Any]] = None
         self._properties: List[Dict[str, Any]] = []
+        # Incremented whenever a new dataset is produced; used to key derived caches
+        self.data_revision = 0
+        # Usage statistics per (property, service) for data_revision
+        self._usage_stats_revision = -1
+        self._usage_stats: Dict[tuple, Optional[Dict[str, Any]]] = {}
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Polls returning the same dataset don't notify listeners
+            always_update=False,
         )
 
+    def _build_dataset(self, usage_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the coordinator dataset, reusing the current one if nothing changed.
+
+        Fetch timestamps differ on every poll, so returning the previous dataset
+        when the usage itself is unchanged is what lets always_update=False skip
+        the sensor state writes.
+        """
+        previous = self.data
+        if (
+            previous is not None
+            and previous.get("customer") == self._customer_data
+            and previous.get("properties") == self._properties
+            and self._usage_unchanged(previous.get("usage_data", {}), usage_data)
+        ):
+            return previous
+
+        self.data_revision += 1
+        return {
+            "customer": self._customer_data,
+            "properties": self._properties,
+            "usage_data": usage_data,
+            "last_update": datetime.now().isoformat(),
+        }
+
+    @staticmethod
+    def _usage_unchanged(previous: Dict[str, Any], current: Dict[str, Any]) -> bool:
+        """Return True if two usage datasets differ only in fetch timestamps."""
+        if previous.keys() != current.keys():
+            return False
+
+        for property_id, property_usage in current.items():
+            previous_usage = previous[property_id]
+            if previous_usage["property"] != property_usage["property"]:
+                return False
+
+            services = property_usage["services"]
+            previous_services = previous_usage["services"]
+            if previous_services.keys() != services.keys():
+                return False
+
+            for service_type, service_data in services.items():
+                previous_service = previous_services[service_type]
+                if (
+                    previous_service["consumer_number"] != service_data["consumer_number"]
+                    or previous_service["usage_data"] != service_data["usage_data"]
+                ):
+                    return False
+
+        return True
+
     # @PerformanceMonitor.time_operation
     @PerformanceMonitor.create_timer_decorator("async_update_data")
     async def _async_update_data(self) -> Dict[str, Any]:
@@ -95,7 +154,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
 
             for property_data in self._properties:
                 property_id = property_data.get("id")
-                if property_id not in self.selected_accounts:
+                if property_id not in self._selected_accounts_set:
                     continue
 
                 property_services = property_data.get("services", [])
@@ -105,7 +164,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                     service_type = service.get("type")
                     consumer_number = service.get("consumer_number")
 
-                    if not consumer_number or service_type not in self.services:
+                    if not consumer_number or service_type not in self._services_set:
                         continue
 
                     if not service.get("active", True):
@@ -160,19 +219,9 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                     len(self._properties), self.selected_accounts, self.services
                 )
                 # Return base dataset so UI can still show customer/properties; sensors may be skipped
-                return {
-                    "customer": self._customer_data,
-                    "properties": self._properties,
-                    "usage_data": {},
-                    "last_update": datetime.now().isoformat(),
-                }
+                return self._build_dataset({})
 
-            return {
-                "customer": self._customer_data,
-                "properties": self._properties,
-                "usage_data": usage_data,
-                "last_update": datetime.now().isoformat(),
-            }
+            return self._build_dataset(usage_data)
 
         except RedEnergyAuthError as err:
             _LOGGER.error("Authentication failed during update: %s", err)
@@ -201,18 +250,11 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
                 raw_properties = await self.api.get_properties()
                 self._properties = validate_properties_data(raw_properties)
 
-            # Use bulk processor for multiple accounts
-            usage_data = await self._data_processor.batch_process_properties(
-                {prop["id"]: {"property": prop, "services": {}} for prop in self._properties if prop["id"] in self.selected_accounts},
-                self.selected_accounts,
-                self.services
-            )
-
             # Fetch actual usage data concurrently
             usage_tasks = []
             for property_data in self._properties:
                 property_id = property_data.get("id")
-                if property_id not in self.selected_accounts:
+                if property_id not in self._selected_accounts_set:
                     continue
 
                 task = asyncio.create_task(
@@ -235,12 +277,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
             if not final_usage_data:
                 raise UpdateFailed("No usage data retrieved for any configured services")
 
-            return {
-                "customer": self._customer_data,
-                "properties": self._properties,
-                "usage_data": final_usage_data,
-                "last_update": datetime.now().isoformat(),
-            }
+            return self._build_dataset(final_usage_data)
 
         except Exception as err:
             await self._error_recovery.async_handle_error(
@@ -260,7 +297,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
             service_type = service.get("type")
             consumer_number = service.get("consumer_number")
 
-            if not consumer_number or service_type not in self.services:
+            if not consumer_number or service_type not in self._services_set:
                 continue
 
             if not service.get("active", True):
@@ -305,7 +342,7 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         # Use data processor for optimized calculations
         for property_data in self._properties:
             property_id = property_data.get("id")
-            if property_id not in self.selected_accounts:
+            if property_id not in self._selected_accounts_set:
                 continue
 
             property_usage = await self._fetch_property_usage(property_data)
@@ -359,6 +396,8 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
         """Update account and service selection."""
         self.selected_accounts = selected_accounts
         self.services = services
+        self._selected_accounts_set = frozenset(selected_accounts)
+        self._services_set = frozenset(services)
 
         # Trigger data refresh with new selection
         await self.async_refresh()
@@ -406,3 +445,59 @@ class RedEnergyDataCoordinator(DataUpdateCoordinator):
             return None
 
         return service_data["usage_data"].get("total_usage", 0.0)
+
+    def get_usage_statistics(
+        self, property_id: str, service_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get daily usage statistics for a property and service.
+
+        Computed once per data update and shared by every sensor that needs it.
+        """
+        if self._usage_stats_revision != self.data_revision:
+            self._usage_stats = {}
+            self._usage_stats_revision = self.data_revision
+
+        key = (property_id, service_type)
+        if key in self._usage_stats:
+            return self._usage_stats[key]
+
+        stats: Optional[Dict[str, Any]] = None
+        service_data = self.get_service_usage(property_id, service_type)
+        if service_data and "usage_data" in service_data:
+            usage_data = service_data["usage_data"].get("usage_data", [])
+            count = 0
+            mean_usage = 0.0
+            squared_deviations = 0.0
+            peak_entry = None
+            peak_usage = None
+            # Welford's algorithm: mean, variance and peak in one pass.
+            # validate_usage_data guarantees every daily entry has a usage.
+            for entry in usage_data:
+                usage = entry["usage"]
+                count += 1
+                delta = usage - mean_usage
+                mean_usage += delta / count
+                squared_deviations += delta * (usage - mean_usage)
+                if peak_entry is None or usage > peak_usage:
+                    peak_usage = usage
+                    peak_entry = entry
+
+            if count:
+                stats = {
+                    "count": count,
+                    "mean": mean_usage,
+                    "std_dev": (squared_deviations / count) ** 0.5,
+                    "peak_usage": peak_usage,
+                    "peak_entry": peak_entry,
+                }
+            else:
+                stats = {
+                    "count": 0,
+                    "mean": 0.0,
+                    "std_dev": 0.0,
+                    "peak_usage": None,
+                    "peak_entry": None,
+                }
+
+        self._usage_stats[key] = stats
+        return stats
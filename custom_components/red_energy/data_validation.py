@@ -1,23 +1,83 @@
 """Data validation utilities for Red Energy integration."""
 from __future__ import annotations
 
+import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-import uuid
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validated customer/properties payloads keyed by the serialized raw input.
+# Results are shared between callers and must be treated as read-only.
+_VALIDATION_CACHE_SIZE = 16
+_validation_cache: OrderedDict[bytes, Any] = OrderedDict()
+
+_EMPTY_ADDRESS: Dict[str, str] = {
+    "street": "",
+    "city": "",
+    "state": "",
+    "postcode": "",
+    "display_address": "",
+    "short_form": "",
+}
+
 
 class DataValidationError(Exception):
     """Exception raised when data validation fails."""
 
 
+def _payload_key(kind: str, data: Any, *extra: Any) -> Optional[bytes]:
+    """Return bytes identifying a raw payload, or None if it can't be serialized."""
+    payload = [kind, data, *extra]
+    try:
+        if orjson is not None:
+            return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        return json.dumps(payload, sort_keys=True).encode()
+    except (TypeError, ValueError):
+        return None
+
+
+def _cache_get(key: Optional[bytes]) -> Any:
+    """Return a cached validation result, or None on a miss."""
+    if key is None:
+        return None
+    result = _validation_cache.get(key)
+    if result is not None:
+        _validation_cache.move_to_end(key)
+    return result
+
+
+def _cache_put(key: Optional[bytes], result: Any) -> None:
+    """Store a validation result, evicting the least recently used entry."""
+    if key is None:
+        return
+    _validation_cache[key] = result
+    if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+        _validation_cache.popitem(last=False)
+
+
+def clear_validation_cache() -> None:
+    """Drop all cached validation results."""
+    _validation_cache.clear()
+
+
 def validate_customer_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate customer data from Red Energy API."""
     if not isinstance(data, dict):
         raise DataValidationError("Customer data must be a dictionary")
 
+    cache_key = _payload_key("customer", data)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     required_fields = ["customerNumber", "name", "email", "accounts"]
     for field in required_fields:
         if field not in data:
@@ -39,8 +99,8 @@ def validate_customer_data(data: Dict[str, Any]) -> Dict[str, Any]:
         "email": str(data["email"]).strip().lower(),
         "accounts": str(data["accounts"]),
         "account_ids": [
-            ".".join([str(account["customerNumber"]), str(account["accountNumber"])])
-                for account in data["accounts"]
+            f"{account['customerNumber']}.{account['accountNumber']}"
+            for account in data["accounts"]
         ],
     }
 
@@ -48,7 +108,9 @@ def validate_customer_data(data: Dict[str, Any]) -> Dict[str, Any]:
     if "phone" in data:
         validated_data["phone"] = str(data["phone"]).strip()
 
-    _LOGGER.debug("Validated customer data: %s", validated_data["name"])
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Validated customer data: %s", validated_data["name"])
+    _cache_put(cache_key, validated_data)
     return validated_data
 
 
@@ -60,6 +122,11 @@ def validate_properties_data(data: List[Dict[str, Any]], client_id: Optional[str
     if not data:
         raise DataValidationError("No properties found in response")
 
+    cache_key = _payload_key("properties", data, client_id)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     validated_properties = []
 
     for i, property_data in enumerate(data):
@@ -74,7 +141,9 @@ def validate_properties_data(data: List[Dict[str, Any]], client_id: Optional[str
     if not validated_properties:
         raise DataValidationError("No valid properties after validation")
 
-    _LOGGER.debug("Validated %d properties", len(validated_properties))
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Validated %d properties", len(validated_properties))
+    _cache_put(cache_key, validated_properties)
     return validated_properties
 
 
@@ -105,12 +174,15 @@ def validate_single_property(data: Dict[str, Any], *, index: int = 0, client_id:
         })
 
     # Get property name from address display
-    address_data = data.get("address", {})
-    property_name = (
-        address_data.get("displayAddresses", {}).get("shortForm") or
-        address_data.get("displayAddress") or
-        f"Property {property_id}"
-    )
+    address_data = data.get("address")
+    if address_data:
+        property_name = (
+            address_data.get("displayAddresses", {}).get("shortForm") or
+            address_data.get("displayAddress") or
+            f"Property {property_id}"
+        )
+    else:
+        property_name = f"Property {property_id}"
 
     validated_property = {
         "id": str(property_id),
@@ -126,8 +198,8 @@ def validate_single_property(data: Dict[str, Any], *, index: int = 0, client_id:
 
 def validate_address(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate address data."""
-    if not isinstance(data, dict):
-        data = {}
+    if not data or not isinstance(data, dict):
+        return dict(_EMPTY_ADDRESS)
 
     # Map API address fields to expected format
     return {
@@ -142,7 +214,7 @@ def validate_address(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def validate_services(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Validate services data."""
-    if not isinstance(data, list):
+    if not data or not isinstance(data, list):
         return []
 
     validated_services = []
@@ -186,49 +258,63 @@ def validate_usage_data(data: Any, consumer_number: str = "") -> Dict[str, Any]:
     validated_entries = []
     total_usage = 0.0
     total_cost = 0.0
-    from_date = None
-    to_date = None
+    usage_dates: List[str] = []
+    failed_entries = 0
+    first_error: Optional[Exception] = None
 
     for entry in data:
+        if not isinstance(entry, dict):
+            failed_entries += 1
+            if first_error is None:
+                first_error = DataValidationError("Usage entry must be a dictionary")
+            continue
+
+        usage_date = entry.get("usageDate")
+        if not usage_date:
+            continue
+
+        # Sum up all half-hour intervals for this day. The API returns JSON
+        # numbers, so values are added directly rather than coerced with float()
+        daily_usage = 0.0
+        daily_cost = 0.0
         try:
-            usage_date = entry.get("usageDate")
-            if not usage_date:
-                continue
-
-            # Track date range
-            if not from_date or usage_date < from_date:
-                from_date = usage_date
-            if not to_date or usage_date > to_date:
-                to_date = usage_date
-
-            # Sum up all half-hour intervals for this day
-            half_hours = entry.get("halfHours", [])
-            daily_usage = 0.0
-            daily_cost = 0.0
-
-            for interval in half_hours:
+            for interval in entry.get("halfHours") or ():
                 # Use GST inclusive pricing for cost
-                daily_usage += float(interval.get("consumptionKwh", 0))
-                daily_cost += float(interval.get("consumptionDollarIncGst", 0))
+                daily_usage += interval.get("consumptionKwh") or 0
+                daily_cost += interval.get("consumptionDollarIncGst") or 0
+        except (AttributeError, TypeError) as err:
+            failed_entries += 1
+            if first_error is None:
+                first_error = err
+            continue
 
-            validated_entries.append({
-                "date": usage_date,
-                "usage": round(daily_usage, 3),
-                "cost": round(daily_cost, 2),
-                "unit": "kWh",
-            })
+        # Track date range; ISO dates compare chronologically as strings
+        usage_dates.append(usage_date)
 
-            total_usage += daily_usage
-            total_cost += daily_cost
+        # Consumption figures are non-negative, so half-up integer scaling
+        # is equivalent to round() here and avoids its per-call overhead
+        validated_entries.append({
+            "date": usage_date,
+            "usage": int(daily_usage * 1000 + 0.5) / 1000,
+            "cost": int(daily_cost * 100 + 0.5) / 100,
+            "unit": "kWh",
+        })
 
-        except Exception as err:
-            _LOGGER.warning("Usage entry validation failed: %s", err)
-            continue
+        total_usage += daily_usage
+        total_cost += daily_cost
+
+    if failed_entries:
+        _LOGGER.warning(
+            "Usage validation skipped %d of %d entries (first error: %s)",
+            failed_entries,
+            len(data),
+            first_error,
+        )
 
     return {
         "consumer_number": consumer_number,
-        "from_date": from_date or "",
-        "to_date": to_date or "",
+        "from_date": min(usage_dates) if usage_dates else "",
+        "to_date": max(usage_dates) if usage_dates else "",
         "usage_data": validated_entries,
         "total_usage": round(total_usage, 2),
         "total_cost": round(total_cost, 2),
@@ -308,7 +394,8 @@ def validate_config_data(config: Dict[str, Any]) -> None:
 
     # Validate email format for username
     username = config["username"]
-    if "@" not in username or "." not in username.split("@")[-1]:
+    at_index = username.rfind("@")
+    if at_index < 0 or username.find(".", at_index) < 0:
         raise DataValidationError("Username must be a valid email address")
 
     # Validate client_id format (should be non-empty string)
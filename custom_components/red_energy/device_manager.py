@@ -2,17 +2,61 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Set
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .const import DOMAIN, MANUFACTURER, SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS
+from .const import (
+    DOMAIN,
+    MANUFACTURER,
+    SENSOR_TYPE_DAILY_AVERAGE,
+    SENSOR_TYPE_EFFICIENCY,
+    SENSOR_TYPE_MONTHLY_AVERAGE,
+    SENSOR_TYPE_PEAK_USAGE,
+    SERVICE_TYPE_ELECTRICITY,
+    SERVICE_TYPE_GAS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Integration software version reported on devices
+SW_VERSION = "1.4.0"
+
+# Sensor types grouped as advanced rather than under their service
+_ADVANCED_SENSOR_TYPES = frozenset(
+    {
+        SENSOR_TYPE_DAILY_AVERAGE,
+        SENSOR_TYPE_MONTHLY_AVERAGE,
+        SENSOR_TYPE_PEAK_USAGE,
+        SENSOR_TYPE_EFFICIENCY,
+    }
+)
+_SERVICE_TYPES = frozenset({SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS})
+# Advanced sensors whose attributes are included in device diagnostics
+_DIAGNOSTIC_ATTRIBUTES_RE = re.compile(
+    "|".join(map(re.escape, (SENSOR_TYPE_EFFICIENCY, SENSOR_TYPE_PEAK_USAGE)))
+)
+
+
+@lru_cache(maxsize=8)
+def _device_model_for_services(services: FrozenSet[str]) -> str:
+    """Return the device model name for a set of enabled services."""
+    has_electricity = SERVICE_TYPE_ELECTRICITY in services
+    has_gas = SERVICE_TYPE_GAS in services
+
+    if has_electricity and has_gas:
+        return "Dual Service Monitor"
+    if has_electricity:
+        return "Electricity Monitor"
+    if has_gas:
+        return "Gas Monitor"
+    return "Energy Monitor"
+
 
 class RedEnergyDeviceManager:
     """Manage Red Energy devices and entity organization."""
@@ -32,7 +76,8 @@ class RedEnergyDeviceManager:
     ) -> Dict[str, DeviceEntry]:
         """Set up devices for all properties with enhanced organization."""
         devices = {}
-        
+        enabled_services = frozenset(services)
+
         for account_id in selected_accounts:
             property_data = coordinator_data.get("usage_data", {}).get(account_id)
             if not property_data:
@@ -40,7 +85,7 @@ class RedEnergyDeviceManager:
                 
             property_info = property_data.get("property", {})
             device = await self._create_property_device(
-                account_id, property_info, services
+                account_id, property_info, enabled_services
             )
             
             if device:
@@ -53,18 +98,15 @@ class RedEnergyDeviceManager:
         self, 
         account_id: str, 
         property_info: Dict[str, Any],
-        services: List[str]
+        services: FrozenSet[str]
     ) -> Optional[DeviceEntry]:
         """Create or update a device for a property."""
         property_name = property_info.get("name", f"Property {account_id}")
         address = property_info.get("address", {})
         
-        # Create comprehensive device identifiers
-        identifiers = {(DOMAIN, account_id)}
-        
         # Enhanced device information
         device_info = {
-            "identifiers": identifiers,
+            "identifiers": {(DOMAIN, account_id)},
             "name": property_name,
             "manufacturer": MANUFACTURER,
             "model": self._get_device_model(services),
@@ -73,18 +115,9 @@ class RedEnergyDeviceManager:
         }
         
         # Add address information if available
-        if address:
-            street = address.get("street_address", "")
-            suburb = address.get("suburb", "")
-            state = address.get("state", "")
-            postcode = address.get("postcode", "")
-            
-            if street and suburb:
-                full_address = f"{street}, {suburb}"
-                if state and postcode:
-                    full_address += f", {state} {postcode}"
-                device_info["suggested_area"] = suburb
-                
+        if address and (suburb := address.get("suburb")):
+            device_info["suggested_area"] = suburb
+
         # Register or update the device
         device = self._device_registry.async_get_or_create(
             config_entry_id=self.config_entry.entry_id,
@@ -96,27 +129,13 @@ class RedEnergyDeviceManager:
         
         return device
 
-    def _get_device_model(self, services: List[str]) -> str:
+    def _get_device_model(self, services: Iterable[str]) -> str:
         """Generate device model based on enabled services."""
-        service_names = []
-        if SERVICE_TYPE_ELECTRICITY in services:
-            service_names.append("Electricity")
-        if SERVICE_TYPE_GAS in services:
-            service_names.append("Gas")
-        
-        if len(service_names) == 2:
-            return "Dual Service Monitor"
-        elif SERVICE_TYPE_ELECTRICITY in services:
-            return "Electricity Monitor"
-        elif SERVICE_TYPE_GAS in services:
-            return "Gas Monitor"
-        else:
-            return "Energy Monitor"
+        return _device_model_for_services(frozenset(services))
 
     def _get_software_version(self) -> str:
         """Get the integration software version."""
-        # This could be enhanced to read from manifest.json
-        return "1.4.0"
+        return SW_VERSION
 
     async def _update_device_attributes(
         self, 
@@ -131,27 +150,27 @@ class RedEnergyDeviceManager:
 
     async def async_cleanup_orphaned_entities(self) -> int:
         """Clean up orphaned entities that no longer have corresponding devices."""
-        cleaned_count = 0
-        
-        # Get all entities for this integration
+        # Both lookups are served from the registries' config entry indexes
         entities = er.async_entries_for_config_entry(
             self._entity_registry, self.config_entry.entry_id
         )
-        
-        # Get all current devices
         devices = dr.async_entries_for_config_entry(
             self._device_registry, self.config_entry.entry_id
         )
-        device_ids = {device.id for device in devices}
-        
-        # Find orphaned entities
-        for entity in entities:
-            if entity.device_id and entity.device_id not in device_ids:
-                _LOGGER.info("Removing orphaned entity: %s", entity.entity_id)
-                self._entity_registry.async_remove(entity.entity_id)
-                cleaned_count += 1
-        
-        return cleaned_count
+        device_ids = frozenset(device.id for device in devices)
+
+        # Find orphaned entities, skipping those never attached to a device
+        orphaned = [
+            entity.entity_id
+            for entity in entities
+            if entity.device_id is not None and entity.device_id not in device_ids
+        ]
+
+        for entity_id in orphaned:
+            _LOGGER.info("Removing orphaned entity: %s", entity_id)
+            self._entity_registry.async_remove(entity_id)
+
+        return len(orphaned)
 
     async def async_organize_entities_by_service(
         self, 
@@ -169,21 +188,18 @@ class RedEnergyDeviceManager:
             "advanced": []
         }
         
+        # Sensor unique IDs are "<domain>_<entry_id>_<property_id>_<service>_<sensor_type>"
+        # and property IDs are numeric, so the tail splits into exactly three parts
+        unique_id_prefix = f"{DOMAIN}_{self.config_entry.entry_id}_"
+
         for entity in entities:
-            entity_id = entity.entity_id
-            
-            # Categorize based on entity ID patterns
-            if SERVICE_TYPE_ELECTRICITY in entity_id:
-                if any(advanced in entity_id for advanced in ["daily_average", "monthly_average", "peak_usage", "efficiency"]):
-                    service_groups["advanced"].append(entity_id)
-                else:
-                    service_groups[SERVICE_TYPE_ELECTRICITY].append(entity_id)
-            elif SERVICE_TYPE_GAS in entity_id:
-                if any(advanced in entity_id for advanced in ["daily_average", "monthly_average", "peak_usage", "efficiency"]):
-                    service_groups["advanced"].append(entity_id)
-                else:
-                    service_groups[SERVICE_TYPE_GAS].append(entity_id)
-        
+            parts = entity.unique_id.removeprefix(unique_id_prefix).split("_", 2)
+            if len(parts) != 3 or parts[1] not in _SERVICE_TYPES:
+                continue
+
+            group = "advanced" if parts[2] in _ADVANCED_SENSOR_TYPES else parts[1]
+            service_groups[group].append(entity.entity_id)
+
         return service_groups
 
     async def async_get_device_diagnostics(self, device: DeviceEntry) -> Dict[str, Any]:
@@ -199,8 +215,9 @@ class RedEnergyDeviceManager:
                 "manufacturer": device.manufacturer,
                 "model": device.model,
                 "sw_version": device.sw_version,
-                "identifiers": list(device.identifiers),
-                "connections": list(device.connections),
+                # Sets are serialized by Home Assistant's JSON encoders
+                "identifiers": device.identifiers,
+                "connections": device.connections,
                 "configuration_url": device.configuration_url,
                 "suggested_area": device.suggested_area,
             },
@@ -208,9 +225,11 @@ class RedEnergyDeviceManager:
             "entities": []
         }
         
-        # Add entity information
+        # Add entity information. last_updated is left as a datetime; Home
+        # Assistant's JSON encoder serializes it when the payload is sent.
+        get_state = self.hass.states.get
         for entity in entities:
-            state = self.hass.states.get(entity.entity_id)
+            state = get_state(entity.entity_id)
             entity_info = {
                 "entity_id": entity.entity_id,
                 "name": entity.name or entity.original_name,
@@ -219,12 +238,12 @@ class RedEnergyDeviceManager:
                 "unit_of_measurement": entity.unit_of_measurement,
                 "state": state.state if state else "unknown",
                 "available": state.state != "unavailable" if state else False,
-                "last_updated": state.last_updated.isoformat() if state else None,
+                "last_updated": state.last_updated if state else None,
             }
             
             # Add attributes for advanced sensors
             if state and state.attributes:
-                if any(advanced in entity.entity_id for advanced in ["efficiency", "peak_usage"]):
+                if _DIAGNOSTIC_ATTRIBUTES_RE.search(entity.entity_id):
                     entity_info["attributes"] = dict(state.attributes)
             
             diagnostics["entities"].append(entity_info)
@@ -299,20 +318,17 @@ class RedEnergyDeviceManager:
         )
         
         # Count available vs unavailable entities
-        available_count = 0
-        unavailable_count = 0
-        
-        for entity in entities:
-            state = self.hass.states.get(entity.entity_id)
-            if state and state.state != "unavailable":
-                available_count += 1
-            else:
-                unavailable_count += 1
-        
+        get_state = self.hass.states.get
+        available_count = sum(
+            1
+            for entity in entities
+            if (state := get_state(entity.entity_id)) and state.state != "unavailable"
+        )
+
         return {
             "total_devices": len(devices),
             "total_entities": len(entities),
             "available_entities": available_count,
-            "unavailable_entities": unavailable_count,
+            "unavailable_entities": len(entities) - available_count,
             "entity_availability_ratio": available_count / len(entities) if entities else 0,
         }
\ No newline at end of file
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Tuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -37,63 +37,103 @@ async def async_get_config_entry_diagnostics(
         },
     }
 
-    # Add coordinator data (sanitized)
+    # Data-derived sections only change when the coordinator produces new data
     if coordinator.data:
-        diagnostics["coordinator_data"] = {
-            "customer": _sanitize_customer_data(coordinator.data.get("customer", {})),
-            "properties_count": len(coordinator.data.get("properties", [])),
-            "usage_data_count": len(coordinator.data.get("usage_data", {})),
-            "last_update": coordinator.data.get("last_update"),
-        }
-
-        # Add property details (sanitized)
-        properties = coordinator.data.get("properties", [])
-        diagnostics["properties"] = []
-        for prop in properties:
-            diagnostics["properties"].append({
-                "id": prop.get("id"),
-                "name": prop.get("name"),
-                "services_count": len(prop.get("services", [])),
-                "services": [
-                    {
-                        "type": service.get("type"),
-                        "active": service.get("active"),
-                        "consumer_number_length": len(service.get("consumer_number", "")),
-                    }
-                    for service in prop.get("services", [])
-                ]
-            })
-
-        # Add usage data summary
-        usage_data = coordinator.data.get("usage_data", {})
-        diagnostics["usage_summary"] = {}
-        for prop_id, prop_data in usage_data.items():
-            services_summary = {}
-            for service_type, service_data in prop_data.get("services", {}).items():
-                usage_info = service_data.get("usage_data", {})
-                daily_data = usage_info.get("usage_data", [])
-                services_summary[service_type] = {
-                    "consumer_number_length": len(service_data.get("consumer_number", "")),
-                    "total_usage": usage_info.get("total_usage"),
-                    "total_cost": usage_info.get("total_cost"),
-                    "daily_entries": len(daily_data),
-                    "from_date": usage_info.get("from_date"),
-                    "to_date": usage_info.get("to_date"),
-                    "last_updated": service_data.get("last_updated"),
-                }
-            diagnostics["usage_summary"][prop_id] = services_summary
-
-    # Add API info
+        cache = entry_data.setdefault("diagnostics_cache", {})
+        cached = cache.get("data")
+        if cached is None or cached[0] != coordinator.data_revision:
+            cached = (
+                coordinator.data_revision,
+                _build_data_diagnostics(coordinator.data, cache),
+            )
+            cache["data"] = cached
+        diagnostics.update(cached[1])
+
+    # Add API info; datetimes are serialized by Home Assistant's diagnostics encoder
     api_info = {
         "api_type": type(coordinator.api).__name__,
         "has_access_token": coordinator.api._access_token is not None,
-        "token_expires": coordinator.api._token_expires.isoformat() if coordinator.api._token_expires else None,
+        "token_expires": coordinator.api._token_expires,
     }
     diagnostics["api_info"] = api_info
 
     return diagnostics
 
 
+def _cached_section(
+    cache: Dict[str, Any], name: str, source: Any, builder: Callable[[Any], Any]
+) -> Any:
+    """Return a diagnostics section, rebuilding it only when its source object changed."""
+    cached = cache.get(name)
+    if cached is None or cached[0] is not source:
+        cached = (source, builder(source))
+        cache[name] = cached
+    return cached[1]
+
+
+def _build_data_diagnostics(data: Dict[str, Any], cache: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the diagnostics sections derived from coordinator data.
+
+    The coordinator reuses its customer and properties objects between polls,
+    so those sections are only rebuilt after they are refetched.
+    """
+    customer = data.get("customer") or {}
+    properties = data.get("properties") or []
+    usage_data = data.get("usage_data") or {}
+
+    return {
+        "coordinator_data": {
+            "customer": _cached_section(cache, "customer", customer, _sanitize_customer_data),
+            "properties_count": len(properties),
+            "usage_data_count": len(usage_data),
+            "last_update": data.get("last_update"),
+        },
+        "properties": _cached_section(cache, "properties", properties, _build_properties_diagnostics),
+        "usage_summary": _cached_section(cache, "usage_summary", usage_data, _build_usage_summary),
+    }
+
+
+def _build_properties_diagnostics(properties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build sanitized property details."""
+    return [
+        {
+            "id": prop.get("id"),
+            "name": prop.get("name"),
+            "services_count": len(prop.get("services", [])),
+            "services": [
+                {
+                    "type": service.get("type"),
+                    "active": service.get("active"),
+                    "consumer_number_length": len(service.get("consumer_number", "")),
+                }
+                for service in prop.get("services", [])
+            ]
+        }
+        for prop in properties
+    ]
+
+
+def _build_usage_summary(usage_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a per-property summary of usage data."""
+    usage_summary = {}
+    for prop_id, prop_data in usage_data.items():
+        services_summary = {}
+        for service_type, service_data in prop_data.get("services", {}).items():
+            usage_info = service_data.get("usage_data", {})
+            daily_data = usage_info.get("usage_data", [])
+            services_summary[service_type] = {
+                "consumer_number_length": len(service_data.get("consumer_number", "")),
+                "total_usage": usage_info.get("total_usage"),
+                "total_cost": usage_info.get("total_cost"),
+                "daily_entries": len(daily_data),
+                "from_date": usage_info.get("from_date"),
+                "to_date": usage_info.get("to_date"),
+                "last_updated": service_data.get("last_updated"),
+            }
+        usage_summary[prop_id] = services_summary
+    return usage_summary
+
+
 def _sanitize_customer_data(customer_data: Dict[str, Any]) -> Dict[str, Any]:
     """Sanitize customer data for diagnostics."""
     if not customer_data:
@@ -113,6 +153,38 @@ def _sanitize_customer_data(customer_data: Dict[str, Any]) -> Dict[str, Any]:
     return sanitized
 
 
+def _calculate_daily_stats(
+    daily_data: List[Dict[str, Any]]
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Return min/max/avg usage and cost statistics in a single pass."""
+    usage_min = usage_max = cost_min = cost_max = None
+    usage_sum = cost_sum = 0.0
+
+    for entry in daily_data:
+        usage = entry.get("usage", 0)
+        cost = entry.get("cost", 0)
+        usage_sum += usage
+        cost_sum += cost
+        if usage_min is None or usage < usage_min:
+            usage_min = usage
+        if usage_max is None or usage > usage_max:
+            usage_max = usage
+        if cost_min is None or cost < cost_min:
+            cost_min = cost
+        if cost_max is None or cost > cost_max:
+            cost_max = cost
+
+    count = len(daily_data)
+    if not count:
+        empty = {"min": 0, "max": 0, "avg": 0}
+        return empty, dict(empty)
+
+    return (
+        {"min": usage_min, "max": usage_max, "avg": usage_sum / count},
+        {"min": cost_min, "max": cost_max, "avg": cost_sum / count},
+    )
+
+
 async def async_get_device_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry, device
 ) -> Dict[str, Any]:
@@ -123,12 +195,16 @@ async def async_get_device_diagnostics(
     entry_data = hass.data[DOMAIN][entry.entry_id]
     coordinator: RedEnergyDataCoordinator = entry_data["coordinator"]
 
-    # Extract property ID from device identifier
-    device_id = None
-    for identifier in device.identifiers:
-        if identifier[0] == DOMAIN:
-            device_id = identifier[1].replace(f"{entry.entry_id}_", "")
-            break
+    # Extract property ID from device identifier; sensor devices are
+    # registered as "<entry_id>_<property_id>"
+    device_id = next(
+        (
+            identifier.removeprefix(f"{entry.entry_id}_")
+            for domain, identifier in device.identifiers
+            if domain == DOMAIN
+        ),
+        None,
+    )
 
     if not device_id or not coordinator.data:
         return {"error": "Device not found or no data available"}
@@ -157,8 +233,7 @@ async def async_get_device_diagnostics(
 
         # Calculate some statistics
         if daily_data:
-            usage_values = [entry.get("usage", 0) for entry in daily_data]
-            cost_values = [entry.get("cost", 0) for entry in daily_data]
+            usage_stats, cost_stats = _calculate_daily_stats(daily_data)
 
             diagnostics["services_data"][service_type] = {
                 "consumer_number_length": len(service_data.get("consumer_number", "")),
@@ -167,16 +242,8 @@ async def async_get_device_diagnostics(
                 "daily_entries": len(daily_data),
                 "from_date": usage_info.get("from_date"),
                 "to_date": usage_info.get("to_date"),
-                "usage_stats": {
-                    "min": min(usage_values) if usage_values else 0,
-                    "max": max(usage_values) if usage_values else 0,
-                    "avg": sum(usage_values) / len(usage_values) if usage_values else 0,
-                },
-                "cost_stats": {
-                    "min": min(cost_values) if cost_values else 0,
-                    "max": max(cost_values) if cost_values else 0,
-                    "avg": sum(cost_values) / len(cost_values) if cost_values else 0,
-                },
+                "usage_stats": usage_stats,
+                "cost_stats": cost_stats,
                 "last_updated": service_data.get("last_updated"),
             }
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from homeassistant.components.energy import (
@@ -18,6 +19,17 @@ from .const import DOMAIN, SERVICE_TYPE_ELECTRICITY, SERVICE_TYPE_GAS
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _slugify_property_name(property_name: str) -> str:
+    """Normalize a property name the way sensor entity IDs are generated."""
+    return property_name.lower().replace(" ", "_").replace("-", "_")
+
+
+def _sensor_entity_id(property_name: str, service_type: str, suffix: str) -> str:
+    """Build the entity ID of a property/service sensor."""
+    return f"sensor.{_slugify_property_name(property_name)}_{service_type}_{suffix}"
+
+
 async def async_get_energy_platform(hass: HomeAssistant) -> EnergyPlatform:
     """Get the Red Energy energy platform."""
     return RedEnergyEnergyPlatform(hass)
@@ -49,25 +61,26 @@ class RedEnergyEnergyPlatform(EnergyPlatform):
         if not coordinator or not coordinator.data:
             return []
 
+        usage_data = coordinator.data.get("usage_data", {})
+
         energy_sources = []
 
         # Create energy sources for each account and service
         for account_id in selected_accounts:
-            property_data = coordinator.get_property_data(account_id)
+            property_data = usage_data.get(account_id)
             if not property_data:
                 continue
 
             property_info = property_data.get("property", {})
             property_name = property_info.get("name", f"Property {account_id}")
+            services_map = property_data.get("services", {})
 
             for service_type in services:
-                service_data = coordinator.get_service_usage(account_id, service_type)
-                if not service_data:
+                if not services_map.get(service_type):
                     continue
 
                 # Create unique entity ID for the total usage sensor
-                entity_id = f"sensor.{property_name.lower().replace(' ', '_')}_{service_type}_total_usage"
-                entity_id = entity_id.replace('-', '_')
+                entity_id = _sensor_entity_id(property_name, service_type, "total_usage")
 
                 if service_type == SERVICE_TYPE_ELECTRICITY:
                     energy_sources.append({
@@ -110,22 +123,7 @@ class RedEnergyEnergyPlatform(EnergyPlatform):
             return None
 
         # Energy dashboard can use cost sensors for pricing
-        cost_sensors = []
-        selected_accounts = entry_data.get("selected_accounts", [])
-        services = entry_data.get("services", [])
-
-        for account_id in selected_accounts:
-            property_data = coordinator.get_property_data(account_id)
-            if not property_data:
-                continue
-
-            property_info = property_data.get("property", {})
-            property_name = property_info.get("name", f"Property {account_id}")
-
-            for service_type in services:
-                entity_id = f"sensor.{property_name.lower().replace(' ', '_')}_{service_type}_total_cost"
-                entity_id = entity_id.replace('-', '_')
-                cost_sensors.append(entity_id)
+        cost_sensors = _get_sensor_entity_ids(entry_data, coordinator, "total_cost")
 
         return {
             "cost_sensors": cost_sensors,
@@ -148,55 +146,59 @@ async def async_setup_energy_platform(hass: HomeAssistant) -> None:
         _LOGGER.error("Failed to set up Red Energy energy platform: %s", err)
 
 
-def get_energy_usage_sensors(entry_data: Dict[str, Any]) -> List[str]:
-    """Get list of energy usage sensor entity IDs."""
+def _get_sensor_entity_ids(
+    entry_data: Dict[str, Any], coordinator: Any, suffix: str
+) -> List[str]:
+    """Return sensor entity IDs for every selected property and service.
+
+    Lists are cached in entry_data per coordinator data revision, since
+    property names only change when the coordinator produces new data.
+    """
     selected_accounts = entry_data.get("selected_accounts", [])
     services = entry_data.get("services", [])
-    coordinator = entry_data.get("coordinator")
+    key = (tuple(selected_accounts), tuple(services), suffix)
 
-    if not coordinator or not coordinator.data:
-        return []
+    cache = entry_data.get("energy_sensor_ids")
+    if cache is None or cache[0] != coordinator.data_revision:
+        cache = (coordinator.data_revision, {})
+        entry_data["energy_sensor_ids"] = cache
 
-    sensors = []
-    for account_id in selected_accounts:
-        property_data = coordinator.get_property_data(account_id)
-        if not property_data:
-            continue
+    sensors = cache[1].get(key)
+    if sensors is None:
+        usage_data = coordinator.data.get("usage_data", {})
+        sensors = []
+        for account_id in selected_accounts:
+            property_data = usage_data.get(account_id)
+            if not property_data:
+                continue
 
-        property_info = property_data.get("property", {})
-        property_name = property_info.get("name", f"Property {account_id}")
+            property_info = property_data.get("property", {})
+            property_name = property_info.get("name", f"Property {account_id}")
 
-        for service_type in services:
-            # Total usage sensor entity ID
-            entity_id = f"sensor.{property_name.lower().replace(' ', '_')}_{service_type}_total_usage"
-            entity_id = entity_id.replace('-', '_')
-            sensors.append(entity_id)
+            for service_type in services:
+                sensors.append(_sensor_entity_id(property_name, service_type, suffix))
+        cache[1][key] = sensors
 
-    return sensors
+    return list(sensors)
 
 
-def get_energy_cost_sensors(entry_data: Dict[str, Any]) -> List[str]:
-    """Get list of energy cost sensor entity IDs."""
-    selected_accounts = entry_data.get("selected_accounts", [])
-    services = entry_data.get("services", [])
+def get_energy_usage_sensors(entry_data: Dict[str, Any]) -> List[str]:
+    """Get list of energy usage sensor entity IDs."""
     coordinator = entry_data.get("coordinator")
 
     if not coordinator or not coordinator.data:
         return []
 
-    sensors = []
-    for account_id in selected_accounts:
-        property_data = coordinator.get_property_data(account_id)
-        if not property_data:
-            continue
+    # Total usage sensor entity IDs
+    return _get_sensor_entity_ids(entry_data, coordinator, "total_usage")
+
 
-        property_info = property_data.get("property", {})
-        property_name = property_info.get("name", f"Property {account_id}")
+def get_energy_cost_sensors(entry_data: Dict[str, Any]) -> List[str]:
+    """Get list of energy cost sensor entity IDs."""
+    coordinator = entry_data.get("coordinator")
 
-        for service_type in services:
-            # Total cost sensor entity ID
-            entity_id = f"sensor.{property_name.lower().replace(' ', '_')}_{service_type}_total_cost"
-            entity_id = entity_id.replace('-', '_')
-            sensors.append(entity_id)
+    if not coordinator or not coordinator.data:
+        return []
 
-    return sensors
\ No newline at end of file
+    # Total cost sensor entity IDs
+    return _get_sensor_entity_ids(entry_data, coordinator, "total_cost")
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import re
+import time
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 from collections import defaultdict, deque
 from enum import Enum
 
@@ -19,6 +22,25 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_VERSION = 1
 ERROR_STORAGE_KEY = f"{DOMAIN}_error_recovery"
+# Seconds to coalesce error bursts into a single storage write
+ERROR_SAVE_DELAY = 30
+# Window for the recent error count, in seconds
+RECENT_ERROR_WINDOW = 86400
+# Shared read-only context for errors reported without one
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+
+def _serializable_context(context: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the JSON-safe part of an error context.
+
+    Contexts may carry live objects such as the coordinator, which would make
+    every delayed storage write fail.
+    """
+    return {
+        key: value
+        for key, value in context.items()
+        if isinstance(value, (str, int, float, bool, type(None)))
+    }
 
 
 class ErrorSeverity(Enum):
@@ -51,9 +73,31 @@ class ErrorType(Enum):
     UNKNOWN = "unknown"
 
 
+# Critical errors that require immediate attention
+_CRITICAL_ERROR_RE = re.compile(
+    r"authentication|authorization|credential|token", re.IGNORECASE
+)
+_HIGH_SEVERITY_TYPES = frozenset({ErrorType.API_AUTHENTICATION, ErrorType.CONFIG_INVALID})
+_MEDIUM_SEVERITY_TYPES = frozenset({ErrorType.API_CONNECTION, ErrorType.COORDINATOR_UPDATE})
+_LOW_SEVERITY_TYPES = frozenset({ErrorType.API_RATE_LIMIT, ErrorType.NETWORK_TIMEOUT})
+# Slot of each error type in the per-type error count list
+_ERROR_TYPE_INDEX = {error_type: index for index, error_type in enumerate(ErrorType)}
+
+
 class ErrorRecord:
     """Record of an error occurrence."""
 
+    __slots__ = (
+        "error_type",
+        "severity",
+        "message",
+        "context",
+        "exception",
+        "timestamp",
+        "recovery_attempts",
+        "resolved",
+    )
+
     def __init__(
         self,
         error_type: ErrorType,
@@ -66,7 +110,9 @@ class ErrorRecord:
         self.error_type = error_type
         self.severity = severity
         self.message = message
-        self.context = context or {}
+        self.context: Mapping[str, Any] = (
+            context if context is not None else _EMPTY_CONTEXT
+        )
         self.exception = exception
         self.timestamp = dt_util.utcnow()
         self.recovery_attempts = 0
@@ -76,6 +122,8 @@ class ErrorRecord:
 class RecoveryAction:
     """Defines a recovery action for specific error types."""
 
+    __slots__ = ("strategy", "action", "max_attempts", "delay", "backoff_factor")
+
     def __init__(
         self,
         strategy: RecoveryStrategy,
@@ -95,92 +143,50 @@ class RecoveryAction:
 class RedEnergyErrorRecoverySystem:
     """Comprehensive error recovery system."""
 
+    # Default recovery actions per error type, tried in order as
+    # (strategy, method name, max attempts, delay, backoff factor)
+    _DEFAULT_RECOVERY_ACTIONS: Dict[
+        ErrorType, Tuple[Tuple[RecoveryStrategy, str, int, float, float], ...]
+    ] = {
+        ErrorType.API_CONNECTION: (
+            (RecoveryStrategy.RETRY, "_retry_api_connection", 3, 10.0, 2.0),
+            (RecoveryStrategy.FALLBACK, "_use_cached_data", 1, 5.0, 2.0),
+        ),
+        ErrorType.API_AUTHENTICATION: (
+            (RecoveryStrategy.RETRY, "_refresh_authentication", 2, 5.0, 2.0),
+            (RecoveryStrategy.NOTIFY, "_notify_authentication_failure", 1, 5.0, 2.0),
+        ),
+        ErrorType.API_RATE_LIMIT: (
+            # Wait 1 minute for rate limit
+            (RecoveryStrategy.RETRY, "_wait_and_retry", 3, 60.0, 2.0),
+        ),
+        ErrorType.COORDINATOR_UPDATE: (
+            (RecoveryStrategy.RETRY, "_retry_coordinator_update", 2, 5.0, 2.0),
+            (RecoveryStrategy.FALLBACK, "_use_last_known_state", 1, 5.0, 2.0),
+        ),
+        ErrorType.ENTITY_UPDATE: (
+            (RecoveryStrategy.RETRY, "_retry_entity_update", 2, 2.0, 2.0),
+            (RecoveryStrategy.FALLBACK, "_restore_entity_state", 1, 5.0, 2.0),
+        ),
+    }
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize error recovery system."""
         self.hass = hass
         self._store = Store(hass, STORAGE_VERSION, ERROR_STORAGE_KEY)
         self._error_history: deque = deque(maxlen=1000)  # Keep last 1000 errors
+        # Number of resolved records currently in the history
+        self._resolved_count = 0
+        # Monotonic times of errors in the history, oldest first
+        self._recent_errors: deque = deque(maxlen=1000)
+        # Storage form of the last 100 errors, serialized once at ingest
+        self._serialized_errors: deque = deque(maxlen=100)
+        # Built from _DEFAULT_RECOVERY_ACTIONS the first time a type is handled
         self._recovery_actions: Dict[ErrorType, List[RecoveryAction]] = {}
-        self._error_counts: Dict[ErrorType, int] = defaultdict(int)
+        self._error_counts: List[int] = [0] * len(ErrorType)
         self._recovery_stats: Dict[str, int] = defaultdict(int)
-        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
-        
-        # Initialize default recovery actions
-        self._setup_default_recovery_actions()
-
-    def _setup_default_recovery_actions(self) -> None:
-        """Set up default recovery actions for common error types."""
-        
-        # API Connection errors
-        self._recovery_actions[ErrorType.API_CONNECTION] = [
-            RecoveryAction(
-                RecoveryStrategy.RETRY,
-                self._retry_api_connection,
-                max_attempts=3,
-                delay=10.0,
-                backoff_factor=2.0
-            ),
-            RecoveryAction(
-                RecoveryStrategy.FALLBACK,
-                self._use_cached_data,
-                max_attempts=1
-            )
-        ]
-        
-        # API Authentication errors
-        self._recovery_actions[ErrorType.API_AUTHENTICATION] = [
-            RecoveryAction(
-                RecoveryStrategy.RETRY,
-                self._refresh_authentication,
-                max_attempts=2,
-                delay=5.0
-            ),
-            RecoveryAction(
-                RecoveryStrategy.NOTIFY,
-                self._notify_authentication_failure,
-                max_attempts=1
-            )
-        ]
-        
-        # Rate limit errors
-        self._recovery_actions[ErrorType.API_RATE_LIMIT] = [
-            RecoveryAction(
-                RecoveryStrategy.RETRY,
-                self._wait_and_retry,
-                max_attempts=3,
-                delay=60.0  # Wait 1 minute for rate limit
-            )
-        ]
-        
-        # Coordinator update errors
-        self._recovery_actions[ErrorType.COORDINATOR_UPDATE] = [
-            RecoveryAction(
-                RecoveryStrategy.RETRY,
-                self._retry_coordinator_update,
-                max_attempts=2,
-                delay=5.0
-            ),
-            RecoveryAction(
-                RecoveryStrategy.FALLBACK,
-                self._use_last_known_state,
-                max_attempts=1
-            )
-        ]
-        
-        # Entity update errors
-        self._recovery_actions[ErrorType.ENTITY_UPDATE] = [
-            RecoveryAction(
-                RecoveryStrategy.RETRY,
-                self._retry_entity_update,
-                max_attempts=2,
-                delay=2.0
-            ),
-            RecoveryAction(
-                RecoveryStrategy.FALLBACK,
-                self._restore_entity_state,
-                max_attempts=1
-            )
-        ]
+        # Keyed by (error type, component) so no key string is built per error
+        self._circuit_breakers: Dict[Tuple[ErrorType, str], CircuitBreaker] = {}
 
     async def async_handle_error(
         self,
@@ -190,97 +196,140 @@ class RedEnergyErrorRecoverySystem:
     ) -> bool:
         """Handle an error with appropriate recovery strategy."""
         
+        message = str(error)
+        
         # Classify error severity
-        severity = self._classify_error_severity(error, error_type)
+        severity = self._classify_error_severity(message, error_type)
         
         # Create error record
-        error_record = ErrorRecord(error_type, severity, str(error), context, error)
-        self._error_history.append(error_record)
-        self._error_counts[error_type] += 1
+        error_record = ErrorRecord(error_type, severity, message, context, error)
+        history = self._error_history
+        if len(history) == history.maxlen and history[0].resolved:
+            self._resolved_count -= 1
+        history.append(error_record)
+        serialized_record = {
+            "error_type": error_type.value,
+            "severity": severity.value,
+            "message": error_record.message,
+            "context": _serializable_context(error_record.context),
+            "timestamp": error_record.timestamp.isoformat(),
+            "recovery_attempts": 0,
+            "resolved": False,
+        }
+        self._serialized_errors.append(serialized_record)
+        self._recent_errors.append(time.monotonic())
+        self._evict_recent_errors()
+        self._error_counts[_ERROR_TYPE_INDEX[error_type]] += 1
+        # Persist lazily; bursts of errors collapse into one write and Store
+        # flushes any pending write when Home Assistant shuts down
+        self._store.async_delay_save(self._build_save_data, ERROR_SAVE_DELAY)
         
         _LOGGER.error(
             "Handling %s error: %s (severity: %s)",
-            error_type.value, str(error), severity.value
+            error_type.value, message, severity.value
         )
         
         # Check circuit breaker
-        circuit_key = f"{error_type.value}_{context.get('component', 'unknown') if context else 'unknown'}"
-        if circuit_key in self._circuit_breakers:
-            circuit_breaker = self._circuit_breakers[circuit_key]
-            if circuit_breaker.is_open():
-                _LOGGER.warning("Circuit breaker is open for %s, skipping recovery", circuit_key)
-                return False
-        else:
-            self._circuit_breakers[circuit_key] = CircuitBreaker(
+        component = error_record.context.get("component", "unknown")
+        circuit_key = (error_type, component)
+        circuit_breaker = self._circuit_breakers.get(circuit_key)
+        if circuit_breaker is None:
+            circuit_breaker = self._circuit_breakers[circuit_key] = CircuitBreaker(
                 failure_threshold=5,
                 recovery_timeout=300  # 5 minutes
             )
+        elif circuit_breaker.is_open():
+            _LOGGER.warning(
+                "Circuit breaker is open for %s_%s, skipping recovery",
+                error_type.value, component
+            )
+            error_record.exception = None
+            return False
         
         # Attempt recovery
         recovery_success = await self._attempt_recovery(error_record)
         
         # Update circuit breaker
         if recovery_success:
-            self._circuit_breakers[circuit_key].record_success()
+            circuit_breaker.record_success()
             self._recovery_stats["successful_recoveries"] += 1
         else:
-            self._circuit_breakers[circuit_key].record_failure()
+            circuit_breaker.record_failure()
             self._recovery_stats["failed_recoveries"] += 1
         
         # Mark error as resolved if recovery was successful
         if recovery_success:
             error_record.resolved = True
-        
-        # Save error data periodically
-        if len(self._error_history) % 50 == 0:
-            await self._save_error_data()
+            self._resolved_count += 1
+        serialized_record["recovery_attempts"] = error_record.recovery_attempts
+        serialized_record["resolved"] = error_record.resolved
+        # The message is kept; dropping the exception releases its traceback frames
+        error_record.exception = None
         
         return recovery_success
 
+    def _get_recovery_actions(self, error_type: ErrorType) -> List[RecoveryAction]:
+        """Return the recovery actions for an error type, building defaults on first use."""
+        recovery_actions = self._recovery_actions.get(error_type)
+        if recovery_actions is None:
+            recovery_actions = self._recovery_actions[error_type] = [
+                RecoveryAction(
+                    strategy,
+                    getattr(self, method_name),
+                    max_attempts=max_attempts,
+                    delay=delay,
+                    backoff_factor=backoff_factor
+                )
+                for strategy, method_name, max_attempts, delay, backoff_factor
+                in self._DEFAULT_RECOVERY_ACTIONS.get(error_type, ())
+            ]
+        return recovery_actions
+
     async def _attempt_recovery(self, error_record: ErrorRecord) -> bool:
         """Attempt recovery using available strategies."""
-        recovery_actions = self._recovery_actions.get(error_record.error_type, [])
+        recovery_actions = self._get_recovery_actions(error_record.error_type)
         
         if not recovery_actions:
             _LOGGER.warning("No recovery actions defined for error type: %s", error_record.error_type.value)
             return False
         
+        # Each action gets its own attempt budget; the record counts them all
         for action in recovery_actions:
-            if error_record.recovery_attempts >= action.max_attempts:
-                continue
-            
-            _LOGGER.debug(
-                "Attempting %s recovery for %s (attempt %d/%d)",
-                action.strategy.value,
-                error_record.error_type.value,
-                error_record.recovery_attempts + 1,
-                action.max_attempts
-            )
-            
-            try:
-                # Calculate delay with exponential backoff
-                delay = action.delay * (action.backoff_factor ** error_record.recovery_attempts)
-                if error_record.recovery_attempts > 0:
-                    await asyncio.sleep(delay)
-                
-                # Execute recovery action
-                success = await action.action(error_record)
-                error_record.recovery_attempts += 1
-                
-                if success:
-                    _LOGGER.info(
-                        "Successfully recovered from %s using %s strategy",
+            for attempt in range(action.max_attempts):
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Attempting %s recovery for %s (attempt %d/%d)",
+                        action.strategy.value,
                         error_record.error_type.value,
-                        action.strategy.value
+                        attempt + 1,
+                        action.max_attempts
                     )
-                    return True
                 
-            except Exception as recovery_error:
-                _LOGGER.error(
-                    "Recovery action failed: %s (strategy: %s)",
-                    recovery_error, action.strategy.value
-                )
-                error_record.recovery_attempts += 1
+                try:
+                    # Back off exponentially before retries; the first attempt runs immediately
+                    if attempt > 0:
+                        await asyncio.sleep(
+                            action.delay * action.backoff_factor ** attempt
+                        )
+                    
+                    # Execute recovery action
+                    success = await action.action(error_record)
+                    error_record.recovery_attempts += 1
+                    
+                    if success:
+                        _LOGGER.info(
+                            "Successfully recovered from %s using %s strategy",
+                            error_record.error_type.value,
+                            action.strategy.value
+                        )
+                        return True
+                    
+                except Exception as recovery_error:
+                    _LOGGER.error(
+                        "Recovery action failed: %s (strategy: %s)",
+                        recovery_error, action.strategy.value
+                    )
+                    error_record.recovery_attempts += 1
         
         _LOGGER.warning(
             "All recovery attempts failed for error type: %s",
@@ -288,24 +337,23 @@ class RedEnergyErrorRecoverySystem:
         )
         return False
 
-    def _classify_error_severity(self, error: Exception, error_type: ErrorType) -> ErrorSeverity:
+    def _classify_error_severity(self, message: str, error_type: ErrorType) -> ErrorSeverity:
         """Classify error severity based on type and content."""
         
         # Critical errors that require immediate attention
-        critical_patterns = ["authentication", "authorization", "credential", "token"]
-        if any(pattern in str(error).lower() for pattern in critical_patterns):
+        if _CRITICAL_ERROR_RE.search(message):
             return ErrorSeverity.CRITICAL
         
         # High severity errors
-        if error_type in [ErrorType.API_AUTHENTICATION, ErrorType.CONFIG_INVALID]:
+        if error_type in _HIGH_SEVERITY_TYPES:
             return ErrorSeverity.HIGH
         
         # Medium severity errors
-        if error_type in [ErrorType.API_CONNECTION, ErrorType.COORDINATOR_UPDATE]:
+        if error_type in _MEDIUM_SEVERITY_TYPES:
             return ErrorSeverity.MEDIUM
         
         # Low severity errors (temporary issues)
-        if error_type in [ErrorType.API_RATE_LIMIT, ErrorType.NETWORK_TIMEOUT]:
+        if error_type in _LOW_SEVERITY_TYPES:
             return ErrorSeverity.LOW
         
         return ErrorSeverity.MEDIUM  # Default
@@ -314,7 +362,7 @@ class RedEnergyErrorRecoverySystem:
     async def _retry_api_connection(self, error_record: ErrorRecord) -> bool:
         """Retry API connection with fresh session."""
         try:
-            context = error_record.context or {}
+            context = error_record.context
             coordinator = context.get("coordinator")
             
             if coordinator and hasattr(coordinator, "api"):
@@ -330,7 +378,7 @@ class RedEnergyErrorRecoverySystem:
     async def _refresh_authentication(self, error_record: ErrorRecord) -> bool:
         """Attempt to refresh authentication credentials."""
         try:
-            context = error_record.context or {}
+            context = error_record.context
             coordinator = context.get("coordinator")
             
             if coordinator and hasattr(coordinator, "async_refresh_credentials"):
@@ -346,7 +394,7 @@ class RedEnergyErrorRecoverySystem:
         """Wait for rate limit to reset and retry."""
         # The delay is handled by the main recovery loop
         try:
-            context = error_record.context or {}
+            context = error_record.context
             coordinator = context.get("coordinator")
             
             if coordinator:
@@ -360,7 +408,7 @@ class RedEnergyErrorRecoverySystem:
     async def _use_cached_data(self, error_record: ErrorRecord) -> bool:
         """Use cached data as fallback."""
         try:
-            context = error_record.context or {}
+            context = error_record.context
             coordinator = context.get("coordinator")
             
             if coordinator and coordinator.data:
@@ -375,7 +423,7 @@ class RedEnergyErrorRecoverySystem:
     async def _retry_coordinator_update(self, error_record: ErrorRecord) -> bool:
         """Retry coordinator data update."""
         try:
-            context = error_record.context or {}
+            context = error_record.context
             coordinator = context.get("coordinator")
             
             if coordinator:
@@ -395,7 +443,7 @@ class RedEnergyErrorRecoverySystem:
     async def _retry_entity_update(self, error_record: ErrorRecord) -> bool:
         """Retry entity state update."""
         try:
-            context = error_record.context or {}
+            context = error_record.context
             entity = context.get("entity")
             
             if entity and hasattr(entity, "async_update"):
@@ -426,54 +474,55 @@ class RedEnergyErrorRecoverySystem:
         
         return False
 
+    def _evict_recent_errors(self) -> None:
+        """Drop recent error times that have left the 24 hour window."""
+        cutoff = time.monotonic() - RECENT_ERROR_WINDOW
+        recent_errors = self._recent_errors
+        while recent_errors and recent_errors[0] <= cutoff:
+            recent_errors.popleft()
+
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get comprehensive error statistics."""
-        recent_errors = [
-            error for error in self._error_history
-            if dt_util.utcnow() - error.timestamp < timedelta(hours=24)
-        ]
+        self._evict_recent_errors()
         
         return {
             "total_errors": len(self._error_history),
-            "recent_errors_24h": len(recent_errors),
-            "error_counts_by_type": dict(self._error_counts),
+            "recent_errors_24h": len(self._recent_errors),
+            "error_counts_by_type": self._error_counts_by_type(),
             "recovery_stats": dict(self._recovery_stats),
             "circuit_breaker_states": {
-                key: {
+                f"{error_type.value}_{component}": {
                     "state": breaker.get_state(),
                     "failure_count": breaker.failure_count,
                     "last_failure": breaker.last_failure_time.isoformat() if breaker.last_failure_time else None
                 }
-                for key, breaker in self._circuit_breakers.items()
+                for (error_type, component), breaker in self._circuit_breakers.items()
             },
-            "resolved_errors": sum(1 for error in self._error_history if error.resolved),
-            "unresolved_errors": sum(1 for error in self._error_history if not error.resolved),
+            "resolved_errors": self._resolved_count,
+            "unresolved_errors": len(self._error_history) - self._resolved_count,
+        }
+
+    def _error_counts_by_type(self) -> Dict[ErrorType, int]:
+        """Return the error counts of every error type seen."""
+        return {
+            error_type: count
+            for error_type, count in zip(ErrorType, self._error_counts)
+            if count
+        }
+
+    def _build_save_data(self) -> Dict[str, Any]:
+        """Build the serializable error data payload."""
+        return {
+            "error_history": list(self._serialized_errors),
+            "error_counts": self._error_counts_by_type(),
+            "recovery_stats": dict(self._recovery_stats),
+            "last_saved": dt_util.utcnow().isoformat()
         }
 
     async def _save_error_data(self) -> None:
-        """Save error data to storage."""
+        """Save error data to storage immediately."""
         try:
-            # Convert error history to serializable format
-            serializable_errors = []
-            for error in list(self._error_history)[-100:]:  # Keep last 100 errors
-                serializable_errors.append({
-                    "error_type": error.error_type.value,
-                    "severity": error.severity.value,
-                    "message": error.message,
-                    "context": error.context,
-                    "timestamp": error.timestamp.isoformat(),
-                    "recovery_attempts": error.recovery_attempts,
-                    "resolved": error.resolved
-                })
-            
-            data = {
-                "error_history": serializable_errors,
-                "error_counts": dict(self._error_counts),
-                "recovery_stats": dict(self._recovery_stats),
-                "last_saved": dt_util.utcnow().isoformat()
-            }
-            
-            await self._store.async_save(data)
+            await self._store.async_save(self._build_save_data())
         except Exception as err:
             _LOGGER.error("Failed to save error data: %s", err)
 
@@ -482,7 +531,12 @@ class RedEnergyErrorRecoverySystem:
         try:
             data = await self._store.async_load()
             if data:
-                self._error_counts.update(data.get("error_counts", {}))
+                for error_type, count in data.get("error_counts", {}).items():
+                    try:
+                        index = _ERROR_TYPE_INDEX[ErrorType(error_type)]
+                    except ValueError:
+                        continue
+                    self._error_counts[index] = count
                 self._recovery_stats.update(data.get("recovery_stats", {}))
                 _LOGGER.debug("Loaded error recovery data from storage")
         except Exception as err:
@@ -492,12 +546,23 @@ class RedEnergyErrorRecoverySystem:
 class CircuitBreaker:
     """Circuit breaker pattern implementation for error handling."""
 
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "failure_count",
+        "last_failure_time",
+        "_last_failure_mono",
+        "state",
+    )
+
     def __init__(self, failure_threshold: int = 5, recovery_timeout: int = 300) -> None:
         """Initialize circuit breaker."""
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.failure_count = 0
+        # Wall clock time is kept for statistics; timing uses the monotonic clock
         self.last_failure_time: Optional[datetime] = None
+        self._last_failure_mono = 0.0
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
 
     def record_success(self) -> None:
@@ -509,15 +574,16 @@ class CircuitBreaker:
         """Record a failed operation."""
         self.failure_count += 1
         self.last_failure_time = dt_util.utcnow()
+        self._last_failure_mono = time.monotonic()
         
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
 
     def is_open(self) -> bool:
         """Check if circuit breaker is open."""
-        if self.state == "OPEN" and self.last_failure_time:
+        if self.state == "OPEN":
             # Check if enough time has passed to try again
-            if dt_util.utcnow() - self.last_failure_time > timedelta(seconds=self.recovery_timeout):
+            if time.monotonic() - self._last_failure_mono > self.recovery_timeout:
                 self.state = "HALF_OPEN"
                 return False
             return True
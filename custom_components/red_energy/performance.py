@@ -3,17 +3,53 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
-from collections import defaultdict, deque
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from collections import OrderedDict, defaultdict, deque
 from functools import lru_cache, wraps
+from operator import itemgetter
 
 from homeassistant.core import HomeAssistant
-from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
+# Operations slower than this are logged, in nanoseconds
+SLOW_OPERATION_NS = 5_000_000_000
+# Maximum number of results kept by DataProcessor.get_cached_calculation
+PROCESSED_CACHE_SIZE = 256
+
+# (date, usage) of a validated daily usage entry
+_date_and_usage = itemgetter("date", "usage")
+
+
+class _OperationStats:
+    """Running timing aggregates for one operation, in nanoseconds."""
+
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "recent")
+
+    def __init__(self) -> None:
+        """Initialize empty aggregates."""
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.recent: deque = deque(maxlen=10)
+
+    def add(self, duration_ns: int) -> None:
+        """Record one operation duration."""
+        if self.count:
+            if duration_ns < self.min_ns:
+                self.min_ns = duration_ns
+            elif duration_ns > self.max_ns:
+                self.max_ns = duration_ns
+        else:
+            self.min_ns = self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        self.recent.append(duration_ns)
+
 
 class PerformanceMonitor:
     """Monitor and optimize performance of Red Energy integration."""
@@ -21,33 +57,37 @@ class PerformanceMonitor:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize performance monitor."""
         self.hass = hass
-        self._timing_data: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self._timing_data: Dict[str, _OperationStats] = defaultdict(_OperationStats)
         self._memory_usage: deque = deque(maxlen=50)
         self._api_calls: Dict[str, int] = defaultdict(int)
         self._cache_hits: int = 0
         self._cache_misses: int = 0
 
     def time_operation(self, operation_name: str):
-        """Decorator to time operations."""
+        """Decorator to time operations in nanoseconds."""
+        # Resolve the stats recorders once so wrapped calls skip the lookups
+        record = self._timing_data[operation_name].add
+        record_error = self._timing_data[f"{operation_name}_error"].add
+        now = time.perf_counter_ns
+
         def decorator(func):
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = now()
                 try:
                     result = await func(*args, **kwargs)
-                    execution_time = time.time() - start_time
-                    self._timing_data[operation_name].append(execution_time)
+                    execution_time = now() - start_time
+                    record(execution_time)
 
-                    if execution_time > 5.0:  # Log slow operations
+                    if execution_time > SLOW_OPERATION_NS:  # Log slow operations
                         _LOGGER.warning(
                             "Slow operation detected: %s took %.2fs",
-                            operation_name, execution_time
+                            operation_name, execution_time / 1e9
                         )
 
                     return result
                 except Exception as err:
-                    execution_time = time.time() - start_time
-                    self._timing_data[f"{operation_name}_error"].append(execution_time)
+                    record_error(now() - start_time)
                     raise err
             return wrapper
         return decorator
@@ -55,24 +95,26 @@ class PerformanceMonitor:
     @staticmethod
     def create_timer_decorator(operation_name: str):
         """Create a standalone timer decorator for use without instance."""
+        now = time.perf_counter_ns
+
         def decorator(func):
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                start_time = time.time()
+                start_time = now()
                 try:
                     result = await func(*args, **kwargs)
-                    execution_time = time.time() - start_time
+                    execution_time = now() - start_time
 
-                    if execution_time > 5.0:  # Log slow operations
+                    if execution_time > SLOW_OPERATION_NS:  # Log slow operations
                         _LOGGER.warning(
                             "Slow operation detected: %s took %.2fs",
-                            operation_name, execution_time
+                            operation_name, execution_time / 1e9
                         )
 
                     return result
                 except Exception as err:
-                    execution_time = time.time() - start_time
-                    _LOGGER.debug("Operation %s failed after %.2fs", operation_name, execution_time)
+                    execution_time = now() - start_time
+                    _LOGGER.debug("Operation %s failed after %.2fs", operation_name, execution_time / 1e9)
                     raise err
             return wrapper
         return decorator
@@ -87,65 +129,70 @@ class PerformanceMonitor:
                 "hit_ratio": self._cache_hits / (self._cache_hits + self._cache_misses) if (self._cache_hits + self._cache_misses) > 0 else 0
             },
             "api_calls": dict(self._api_calls),
-            "total_operations": sum(len(times) for times in self._timing_data.values())
+            "total_operations": sum(times.count for times in self._timing_data.values())
         }
 
-        # Calculate timing statistics
+        # Calculate timing statistics, reported in seconds
         for operation, times in self._timing_data.items():
-            if times:
-                times_list = list(times)
+            if times.count:
                 stats["timing_stats"][operation] = {
-                    "count": len(times_list),
-                    "avg_time": sum(times_list) / len(times_list),
-                    "min_time": min(times_list),
-                    "max_time": max(times_list),
-                    "recent_avg": sum(list(times)[-10:]) / min(10, len(times))
+                    "count": times.count,
+                    "avg_time": times.total_ns / times.count / 1e9,
+                    "min_time": times.min_ns / 1e9,
+                    "max_time": times.max_ns / 1e9,
+                    "recent_avg": sum(times.recent) / len(times.recent) / 1e9
                 }
 
         return stats
 
 
-class DataProcessor:
-    """Optimized data processing for Red Energy data."""
+@lru_cache(maxsize=256)
+def _calculate_daily_stats(usage_data_tuple: Tuple[Tuple[str, float], ...]) -> Dict[str, float]:
+    """Calculate daily statistics with caching.
 
-    def __init__(self, performance_monitor: PerformanceMonitor) -> None:
-        """Initialize data processor."""
-        self._monitor = performance_monitor
-        self._processed_cache: Dict[str, Tuple[datetime, Any]] = {}
-        self._cache_ttl = timedelta(minutes=5)
+    Module level so the cache is shared between processors and does not keep
+    them alive.
+    """
+    if not usage_data_tuple:
+        return {"mean": 0, "std_dev": 0, "min": 0, "max": 0}
 
-    @lru_cache(maxsize=128)
-    def _calculate_daily_stats(self, usage_data_tuple: Tuple[Tuple[str, float], ...]) -> Dict[str, float]:
-        """Calculate daily statistics with caching."""
-        usage_data = [{"date": date, "usage": usage} for date, usage in usage_data_tuple]
+    usages = [usage for _, usage in usage_data_tuple]
+    count = len(usages)
+    mean_usage = sum(usages) / count
 
-        if not usage_data:
-            return {"mean": 0, "std_dev": 0, "min": 0, "max": 0}
+    if count > 1:
+        variance = sum([(x - mean_usage) ** 2 for x in usages]) / count
+        std_dev = variance ** 0.5
+    else:
+        std_dev = 0
 
-        usages = [item["usage"] for item in usage_data]
-        mean_usage = sum(usages) / len(usages)
+    return {
+        "mean": mean_usage,
+        "std_dev": std_dev,
+        "min": min(usages),
+        "max": max(usages),
+        "count": count
+    }
 
-        if len(usages) > 1:
-            variance = sum((x - mean_usage) ** 2 for x in usages) / len(usages)
-            std_dev = variance ** 0.5
-        else:
-            std_dev = 0
 
-        return {
-            "mean": mean_usage,
-            "std_dev": std_dev,
-            "min": min(usages),
-            "max": max(usages),
-            "count": len(usages)
-        }
+class DataProcessor:
+    """Optimized data processing for Red Energy data."""
+
+    def __init__(self, performance_monitor: PerformanceMonitor) -> None:
+        """Initialize data processor."""
+        self._monitor = performance_monitor
+        # LRU ordered; values are (monotonic insert time, result)
+        self._processed_cache: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._cache_ttl = 300.0  # Seconds
 
     def get_cached_calculation(self, cache_key: str, calculation_func, *args) -> Any:
         """Get cached calculation result or compute if expired."""
-        now = dt_util.utcnow()
+        now = time.monotonic()
 
         if cache_key in self._processed_cache:
             cached_time, cached_result = self._processed_cache[cache_key]
             if now - cached_time < self._cache_ttl:
+                self._processed_cache.move_to_end(cache_key)
                 self._monitor._cache_hits += 1
                 return cached_result
 
@@ -153,6 +200,9 @@ class DataProcessor:
         self._monitor._cache_misses += 1
         result = calculation_func(*args)
         self._processed_cache[cache_key] = (now, result)
+        self._processed_cache.move_to_end(cache_key)
+        if len(self._processed_cache) > PROCESSED_CACHE_SIZE:
+            self._processed_cache.popitem(last=False)
 
         return result
 
@@ -163,10 +213,38 @@ class DataProcessor:
         services: List[str]
     ) -> Dict[str, Dict[str, Any]]:
         """Batch process multiple properties for efficiency."""
-        results = {}
+        return self._process_properties(usage_data, selected_accounts, services)
+
+    def build_sensor_values(
+        self,
+        usage_data: Dict[str, Any],
+        selected_accounts: List[str],
+        services: List[str],
+        advanced_sensors_enabled: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Process usage data and calculate sensor values in a single pass.
 
-        # Pre-calculate common data
-        current_date = dt_util.now().date()
+        Equivalent to optimize_sensor_calculations(batch_process_properties(...))
+        without building the intermediate processed data.
+        """
+        return self._process_properties(
+            usage_data,
+            selected_accounts,
+            services,
+            self._advanced_sensor_values
+            if advanced_sensors_enabled
+            else self._core_sensor_values
+        )
+
+    def _process_properties(
+        self,
+        usage_data: Dict[str, Any],
+        selected_accounts: List[str],
+        services: List[str],
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Process each property service, optionally transforming the result."""
+        results = {}
 
         for account_id in selected_accounts:
             property_data = usage_data.get(account_id, {})
@@ -174,32 +252,30 @@ class DataProcessor:
                 continue
 
             property_results = {}
+            services_data = property_data.get("services", {})
 
             # Process each service for this property
             for service_type in services:
-                service_data = property_data.get("services", {}).get(service_type, {})
+                service_data = services_data.get(service_type, {})
                 usage_info = service_data.get("usage_data", {})
                 daily_data = usage_info.get("usage_data", [])
 
                 if not daily_data:
                     continue
 
-                # Convert to tuple for caching
-                usage_tuple = tuple((item.get("date", ""), item.get("usage", 0)) for item in daily_data)
-                cache_key = f"{account_id}_{service_type}_{hash(usage_tuple)}"
+                # Convert to tuple for caching; the statistics are lru_cache'd.
+                # Entries come from validate_usage_data, so both keys exist.
+                usage_tuple = tuple(map(_date_and_usage, daily_data))
+                daily_stats = _calculate_daily_stats(usage_tuple)
 
-                # Calculate daily statistics with caching
-                daily_stats = self.get_cached_calculation(
-                    f"daily_stats_{cache_key}",
-                    self._calculate_daily_stats,
-                    usage_tuple
-                )
-
-                property_results[service_type] = {
+                processed = {
                     "usage_info": usage_info,
                     "daily_stats": daily_stats,
                     "daily_data": daily_data
                 }
+                property_results[service_type] = (
+                    transform(processed) if transform else processed
+                )
 
             results[account_id] = property_results
 
@@ -211,37 +287,46 @@ class DataProcessor:
         advanced_sensors_enabled: bool = False
     ) -> Dict[str, Dict[str, Any]]:
         """Optimize sensor value calculations."""
-        sensor_values = {}
-
-        for account_id, property_data in processed_data.items():
-            property_sensors = {}
-
-            for service_type, service_data in property_data.items():
-                usage_info = service_data["usage_info"]
-                daily_stats = service_data["daily_stats"]
-                daily_data = service_data["daily_data"]
+        # Pick the per-service calculation once rather than branching per service
+        calculate = (
+            self._advanced_sensor_values
+            if advanced_sensors_enabled
+            else self._core_sensor_values
+        )
 
-                # Core sensors (always calculated)
-                service_sensors = {
-                    "daily_usage": self._get_latest_daily_usage(daily_data),
-                    "total_cost": usage_info.get("total_cost", 0),
-                    "total_usage": usage_info.get("total_usage", 0)
-                }
+        return {
+            account_id: {
+                service_type: calculate(service_data)
+                for service_type, service_data in property_data.items()
+            }
+            for account_id, property_data in processed_data.items()
+        }
 
-                # Advanced sensors (only if enabled)
-                if advanced_sensors_enabled and daily_stats["count"] > 0:
-                    service_sensors.update({
-                        "daily_average": daily_stats["mean"],
-                        "monthly_average": daily_stats["mean"] * 30.44,
-                        "peak_usage": self._calculate_peak_usage(daily_data),
-                        "efficiency": self._calculate_efficiency_rating(daily_stats)
-                    })
+    def _core_sensor_values(self, service_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate the sensor values that are always provided."""
+        usage_info = service_data["usage_info"]
 
-                property_sensors[service_type] = service_sensors
+        return {
+            "daily_usage": self._get_latest_daily_usage(service_data["daily_data"]),
+            "total_cost": usage_info.get("total_cost", 0),
+            "total_usage": usage_info.get("total_usage", 0)
+        }
 
-            sensor_values[account_id] = property_sensors
+    def _advanced_sensor_values(self, service_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Calculate core and advanced sensor values."""
+        service_sensors = self._core_sensor_values(service_data)
+        daily_stats = service_data["daily_stats"]
+
+        if daily_stats["count"] > 0:
+            daily_data = service_data["daily_data"]
+            service_sensors.update({
+                "daily_average": daily_stats["mean"],
+                "monthly_average": daily_stats["mean"] * 30.44,
+                "peak_usage": self._calculate_peak_usage(daily_data),
+                "efficiency": self._calculate_efficiency_rating(daily_stats)
+            })
 
-        return sensor_values
+        return service_sensors
 
     def _get_latest_daily_usage(self, daily_data: List[Dict[str, Any]]) -> float:
         """Get the most recent daily usage value."""
@@ -256,7 +341,9 @@ class DataProcessor:
         if not daily_data:
             return {"usage": 0, "date": None, "cost": 0}
 
-        max_entry = max(daily_data, key=lambda x: x.get("usage", 0))
+        # Scan a flat usage list rather than calling a key function per entry
+        usages = [entry.get("usage", 0) for entry in daily_data]
+        max_entry = daily_data[usages.index(max(usages))]
 
         return {
             "usage": max_entry.get("usage", 0),
@@ -297,7 +384,7 @@ class DataProcessor:
         """Clear processing cache and return number of items cleared."""
         cache_size = len(self._processed_cache)
         self._processed_cache.clear()
-        self._calculate_daily_stats.cache_clear()
+        _calculate_daily_stats.cache_clear()
         return cache_size
 
 
@@ -316,39 +403,33 @@ class BulkOperationManager:
         coordinators: List[Any],
         batch_size: int = 3
     ) -> Dict[str, bool]:
-        """Refresh multiple coordinators in batches."""
+        """Refresh multiple coordinators, at most batch_size at a time.
+
+        A slot is handed to the next coordinator as soon as one finishes, so a
+        slow refresh does not hold back the rest of its batch.
+        """
         results = {}
+        semaphore = asyncio.Semaphore(batch_size)
+
+        async def refresh(coordinator) -> Tuple[str, Any]:
+            async with semaphore:
+                try:
+                    return coordinator.username, await self._refresh_single_coordinator(coordinator)
+                except Exception as err:
+                    return coordinator.username, err
 
-        # Process coordinators in batches
-        for i in range(0, len(coordinators), batch_size):
-            batch = coordinators[i:i + batch_size]
+        tasks = [
+            asyncio.create_task(refresh(coordinator), name=f"refresh_{coordinator.username}")
+            for coordinator in coordinators
+        ]
 
-            # Create tasks for concurrent execution
-            tasks = []
-            for coordinator in batch:
-                task = asyncio.create_task(
-                    self._refresh_single_coordinator(coordinator),
-                    name=f"refresh_{coordinator.username}"
-                )
-                tasks.append((coordinator.username, task))
-
-            # Wait for batch completion
-            batch_results = await asyncio.gather(
-                *[task for _, task in tasks],
-                return_exceptions=True
-            )
-
-            # Process results
-            for (username, _), result in zip(tasks, batch_results):
-                if isinstance(result, Exception):
-                    _LOGGER.error("Failed to refresh coordinator %s: %s", username, result)
-                    results[username] = False
-                else:
-                    results[username] = result
-
-            # Small delay between batches to prevent overwhelming the API
-            if i + batch_size < len(coordinators):
-                await asyncio.sleep(0.5)
+        for next_done in asyncio.as_completed(tasks):
+            username, result = await next_done
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to refresh coordinator %s: %s", username, result)
+                results[username] = False
+            else:
+                results[username] = result
 
         return results
 
@@ -368,30 +449,25 @@ class BulkOperationManager:
     ) -> int:
         """Update multiple entities efficiently."""
         updated_count = 0
+        states = self.hass.states
 
-        # Group updates by platform for efficiency
-        platform_groups = defaultdict(list)
+        # One pass over the updates; a failing entity does not stop the rest
         for entity_id, update_data in entity_updates.items():
-            platform = entity_id.split('.')[0]
-            platform_groups[platform].append((entity_id, update_data))
+            state = states.get(entity_id)
+            if not state:
+                continue
 
-        # Process each platform group
-        for platform, updates in platform_groups.items():
             try:
-                # Batch update entities in the same platform
-                for entity_id, update_data in updates:
-                    state = self.hass.states.get(entity_id)
-                    if state:
-                        # Update entity state
-                        self.hass.states.async_set(
-                            entity_id,
-                            update_data.get("state", state.state),
-                            update_data.get("attributes", state.attributes)
-                        )
-                        updated_count += 1
-
+                states.async_set(
+                    entity_id,
+                    update_data.get("state", state.state),
+                    update_data.get("attributes", state.attributes)
+                )
             except Exception as err:
-                _LOGGER.error("Failed to bulk update %s entities: %s", platform, err)
+                _LOGGER.error("Failed to bulk update %s: %s", entity_id, err)
+                continue
+
+            updated_count += 1
 
         return updated_count
 
@@ -444,7 +520,8 @@ class MemoryOptimizer:
         if not daily_data:
             return []
 
-        weekly_groups = defaultdict(list)
+        # Running [usage total, cost total, days] per week start
+        weekly_totals: Dict[Any, List[float]] = {}
 
         for entry in daily_data:
             date_str = entry.get("date", "")
@@ -453,55 +530,53 @@ class MemoryOptimizer:
 
             try:
                 date_obj = datetime.fromisoformat(date_str).date()
-                # Group by week (Monday = 0)
-                week_start = date_obj - timedelta(days=date_obj.weekday())
-                weekly_groups[week_start].append(entry)
             except (ValueError, TypeError):
                 continue
 
+            # Group by week (Monday = 0)
+            week_start = date_obj - timedelta(days=date_obj.weekday())
+            totals = weekly_totals.get(week_start)
+            if totals is None:
+                totals = weekly_totals[week_start] = [0, 0, 0]
+            totals[0] += entry.get("usage", 0)
+            totals[1] += entry.get("cost", 0)
+            totals[2] += 1
+
         # Calculate weekly averages
         weekly_averages = []
-        for week_start, entries in weekly_groups.items():
-            if not entries:
-                continue
-
-            avg_usage = sum(e.get("usage", 0) for e in entries) / len(entries)
-            avg_cost = sum(e.get("cost", 0) for e in entries) / len(entries)
-
+        for week_start, (usage_total, cost_total, days) in weekly_totals.items():
             weekly_averages.append({
                 "date": week_start.isoformat(),
-                "usage": round(avg_usage, 2),
-                "cost": round(avg_cost, 2),
+                "usage": round(usage_total / days, 2),
+                "cost": round(cost_total / days, 2),
                 "data_type": "weekly_average",
-                "days_included": len(entries)
+                "days_included": days
             })
 
         return weekly_averages
 
     def get_memory_usage_stats(self, data_structure: Any) -> Dict[str, Any]:
         """Get memory usage statistics for a data structure."""
-        import sys
-
-        def get_size(obj, seen=None):
-            """Get approximate size of object in bytes."""
-            if seen is None:
-                seen = set()
-
+        # Approximate size in bytes, walking containers iteratively and
+        # counting shared objects once
+        getsizeof = sys.getsizeof
+        seen: Set[int] = set()
+        stack = [data_structure]
+        total_size = 0
+        while stack:
+            obj = stack.pop()
             obj_id = id(obj)
             if obj_id in seen:
-                return 0
+                continue
 
             seen.add(obj_id)
-            size = sys.getsizeof(obj)
+            total_size += getsizeof(obj)
 
             if isinstance(obj, dict):
-                size += sum(get_size(k, seen) + get_size(v, seen) for k, v in obj.items())
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
             elif isinstance(obj, (list, tuple, set, frozenset)):
-                size += sum(get_size(i, seen) for i in obj)
-
-            return size
-
-        total_size = get_size(data_structure)
+                stack.extend(obj)
 
         return {
             "total_bytes": total_size,
@@ -509,15 +584,17 @@ class MemoryOptimizer:
             "object_count": self._count_objects(data_structure),
         }
 
-    def _count_objects(self, obj, count=0) -> int:
+    def _count_objects(self, obj: Any) -> int:
         """Count total number of objects in a data structure."""
-        count += 1
-
-        if isinstance(obj, dict):
-            for v in obj.values():
-                count = self._count_objects(v, count)
-        elif isinstance(obj, (list, tuple)):
-            for item in obj:
-                count = self._count_objects(item, count)
+        count = 0
+        stack = [obj]
+        while stack:
+            item = stack.pop()
+            count += 1
+
+            if isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
 
         return count
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import TYPE_CHECKING, Any, Optional
 
 from homeassistant.components.sensor import (
@@ -35,6 +36,16 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Native units of energy sensors by service type
+_ENERGY_UNITS = {
+    SERVICE_TYPE_ELECTRICITY: UnitOfEnergy.KILO_WATT_HOUR,
+    SERVICE_TYPE_GAS: "MJ",  # Megajoules
+}
+_COST_PER_UNIT_UNITS = {
+    SERVICE_TYPE_ELECTRICITY: "AUD/kWh",
+    SERVICE_TYPE_GAS: "AUD/MJ",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,30 +63,21 @@ async def async_setup_entry(
     # Check if advanced sensors are enabled
     advanced_sensors_enabled = config_entry.options.get(CONF_ENABLE_ADVANCED_SENSORS, False)
 
-    entities = []
+    sensor_classes = CORE_SENSOR_CLASSES
+    if advanced_sensors_enabled:
+        sensor_classes += ADVANCED_SENSOR_CLASSES
 
     # Create sensors for each selected account and service
-    for account_id in selected_accounts:
-        for service_type in services:
-            # Core sensors (always created)
-            entities.extend([
-                RedEnergyUsageSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyCostSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyCostPerUnitSensor(coordinator, config_entry, account_id, service_type),
-                RedEnergyTotalUsageSensor(coordinator, config_entry, account_id, service_type),
-            ])
-
-            # Advanced sensors (optional)
-            if advanced_sensors_enabled:
-                entities.extend([
-                    RedEnergyDailyAverageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyMonthlyAverageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyPeakUsageSensor(coordinator, config_entry, account_id, service_type),
-                    RedEnergyEfficiencySensor(coordinator, config_entry, account_id, service_type),
-                ])
+    entities = [
+        sensor_class(coordinator, config_entry, account_id, service_type)
+        for account_id in selected_accounts
+        for service_type in services
+        for sensor_class in sensor_classes
+    ]
 
     _LOGGER.debug("Created %d sensors (%d advanced) for Red Energy integration",
-                 len(entities), len(entities) - (len(selected_accounts) * len(services) * 4))
+                 len(entities),
+                 len(entities) - (len(selected_accounts) * len(services) * len(CORE_SENSOR_CLASSES)))
     async_add_entities(entities)
 
 
@@ -95,13 +97,16 @@ class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
 
         self._config_entry = config_entry
         self._property_id = property_id
-        self._service_type = service_type
+        # Shared by every sensor of the service; intern to keep one copy
+        self._service_type = service_type = sys.intern(service_type)
         self._sensor_type = sensor_type
 
         # Get property info for naming
         property_data = None
-        if coordinator.data and "usage_data" in coordinator.data:
-            property_data = coordinator.data["usage_data"].get(property_id, {}).get("property")
+        data = coordinator.data
+        property_usage = data.get("usage_data", {}).get(property_id) if data else None
+        if property_usage:
+            property_data = property_usage.get("property")
 
         property_name = "Unknown Property"
         if property_data:
@@ -110,7 +115,9 @@ class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
         service_display = service_type.title()
 
         self._attr_name = f"{property_name} {service_display} {sensor_type.title()}"
-        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{property_id}_{service_type}_{sensor_type}"
+        self._attr_unique_id = sys.intern(
+            f"{DOMAIN}_{config_entry.entry_id}_{property_id}_{service_type}_{sensor_type}"
+        )
 
         # Set device info for grouping
         self._attr_device_info = {
@@ -121,13 +128,23 @@ class RedEnergyBaseSensor(CoordinatorEntity, SensorEntity):
             "via_device": (DOMAIN, config_entry.entry_id),
         }
 
+    def _apply_energy_attrs(self, state_class: SensorStateClass) -> None:
+        """Set the device class, unit and state class of an energy sensor."""
+        unit = _ENERGY_UNITS.get(self._service_type)
+        if unit is not None:
+            self._attr_device_class = SensorDeviceClass.ENERGY
+            self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        coordinator = self.coordinator
+        data = coordinator.data
         return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self._property_id in self.coordinator.data.get("usage_data", {})
+            coordinator.last_update_success
+            and data is not None
+            and self._property_id in (data.get("usage_data") or ())
         )
 
 
@@ -144,15 +161,7 @@ class RedEnergyUsageSensor(RedEnergyBaseSensor):
         """Initialize the usage sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, "daily_usage")
 
-        # Set appropriate device class and unit
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"  # Megajoules
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+        self._apply_energy_attrs(SensorStateClass.TOTAL_INCREASING)
 
     @property
     def native_value(self) -> Optional[float]:
@@ -224,13 +233,7 @@ class RedEnergyCostPerUnitSensor(RedEnergyBaseSensor):
         super().__init__(coordinator, config_entry, property_id, service_type, "cost_per_unit")
 
         self._attr_device_class = SensorDeviceClass.MONETARY
-        # Set appropriate cost per unit based on service type
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_native_unit_of_measurement = "AUD/kWh"
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_native_unit_of_measurement = "AUD/MJ"
-        else:
-            self._attr_native_unit_of_measurement = "AUD"
+        self._attr_native_unit_of_measurement = _COST_PER_UNIT_UNITS.get(service_type, "AUD")
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
@@ -251,12 +254,15 @@ class RedEnergyCostPerUnitSensor(RedEnergyBaseSensor):
         if not service_data:
             return None
 
+        # Totals come from the service data already in hand
+        usage_data = service_data.get("usage_data")
+
         return {
             "consumer_number": service_data.get("consumer_number"),
             "last_updated": service_data.get("last_updated"),
             "service_type": self._service_type,
-            "total_cost": self.coordinator.get_total_cost(self._property_id, self._service_type),
-            "total_usage": self.coordinator.get_total_usage(self._property_id, self._service_type),
+            "total_cost": usage_data.get("total_cost", 0.0) if usage_data is not None else None,
+            "total_usage": usage_data.get("total_usage", 0.0) if usage_data is not None else None,
             "period": "30 days",
         }
 
@@ -274,15 +280,7 @@ class RedEnergyTotalUsageSensor(RedEnergyBaseSensor):
         """Initialize the total usage sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, "total_usage")
 
-        # Set appropriate device class and unit
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"  # Megajoules
-
-        self._attr_state_class = SensorStateClass.TOTAL
+        self._apply_energy_attrs(SensorStateClass.TOTAL)
 
     @property
     def native_value(self) -> Optional[float]:
@@ -323,30 +321,16 @@ class RedEnergyDailyAverageSensor(RedEnergyBaseSensor):
         """Initialize the daily average sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, SENSOR_TYPE_DAILY_AVERAGE)
 
-        # Set appropriate device class and unit
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._apply_energy_attrs(SensorStateClass.MEASUREMENT)
 
     @property
     def native_value(self) -> Optional[float]:
         """Return the daily average usage."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data or "usage_data" not in service_data:
+        stats = self.coordinator.get_usage_statistics(self._property_id, self._service_type)
+        if stats is None:
             return None
 
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        if not usage_data:
-            return 0.0
-
-        # Calculate average daily usage
-        total_usage = sum(entry.get("usage", 0) for entry in usage_data)
-        return round(total_usage / len(usage_data), 2) if usage_data else 0.0
+        return round(stats["mean"], 2) if stats["count"] else 0.0
 
     @property
     def extra_state_attributes(self) -> Optional[dict[str, Any]]:
@@ -355,10 +339,10 @@ class RedEnergyDailyAverageSensor(RedEnergyBaseSensor):
         if not service_data:
             return None
 
-        usage_data = service_data["usage_data"].get("usage_data", [])
+        stats = self.coordinator.get_usage_statistics(self._property_id, self._service_type)
         return {
             "consumer_number": service_data.get("consumer_number"),
-            "calculation_period": f"{len(usage_data)} days",
+            "calculation_period": f"{stats['count'] if stats else 0} days",
             "service_type": self._service_type,
         }
 
@@ -376,14 +360,7 @@ class RedEnergyMonthlyAverageSensor(RedEnergyBaseSensor):
         """Initialize the monthly average sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, SENSOR_TYPE_MONTHLY_AVERAGE)
 
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._apply_energy_attrs(SensorStateClass.MEASUREMENT)
 
     @property
     def native_value(self) -> Optional[float]:
@@ -409,43 +386,26 @@ class RedEnergyPeakUsageSensor(RedEnergyBaseSensor):
         """Initialize the peak usage sensor."""
         super().__init__(coordinator, config_entry, property_id, service_type, SENSOR_TYPE_PEAK_USAGE)
 
-        if service_type == SERVICE_TYPE_ELECTRICITY:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        elif service_type == SERVICE_TYPE_GAS:
-            self._attr_device_class = SensorDeviceClass.ENERGY
-            self._attr_native_unit_of_measurement = "MJ"
-
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._apply_energy_attrs(SensorStateClass.MEASUREMENT)
 
     @property
     def native_value(self) -> Optional[float]:
         """Return the peak daily usage."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        if not usage_data:
+        stats = self.coordinator.get_usage_statistics(self._property_id, self._service_type)
+        if not stats or not stats["count"]:
             return None
 
-        # Find peak daily usage
-        usage_values = [entry.get("usage", 0) for entry in usage_data]
-        return max(usage_values) if usage_values else 0
+        return stats["peak_usage"]
 
     @property
     def extra_state_attributes(self) -> Optional[dict[str, Any]]:
         """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        if not usage_data:
+        stats = self.coordinator.get_usage_statistics(self._property_id, self._service_type)
+        if not stats or not stats["count"]:
             return None
 
-        # Find peak date
-        peak_entry = max(usage_data, key=lambda x: x.get("usage", 0))
+        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        peak_entry = stats["peak_entry"]
 
         return {
             "consumer_number": service_data.get("consumer_number"),
@@ -475,28 +435,23 @@ class RedEnergyEfficiencySensor(RedEnergyBaseSensor):
     @property
     def native_value(self) -> Optional[float]:
         """Return the efficiency rating (0-100%)."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
+        return self._efficiency(
+            self.coordinator.get_usage_statistics(self._property_id, self._service_type)
+        )
 
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        if len(usage_data) < 7:  # Need at least a week of data
+    @staticmethod
+    def _efficiency(stats: Optional[dict[str, Any]]) -> Optional[float]:
+        """Return the efficiency rating for usage statistics."""
+        if not stats or stats["count"] < 7:  # Need at least a week of data
             return None
 
         # Calculate efficiency based on usage consistency and trends
-        usage_values = [entry.get("usage", 0) for entry in usage_data]
-
-        # Calculate coefficient of variation (lower is more efficient/consistent)
-        if not usage_values or len(usage_values) < 2:
-            return None
-
-        mean_usage = sum(usage_values) / len(usage_values)
+        mean_usage = stats["mean"]
         if mean_usage == 0:
             return 100  # Perfect efficiency if no usage
 
-        variance = sum((x - mean_usage) ** 2 for x in usage_values) / len(usage_values)
-        std_dev = variance ** 0.5
-        cv = std_dev / mean_usage
+        # Calculate coefficient of variation (lower is more efficient/consistent)
+        cv = stats["std_dev"] / mean_usage
 
         # Convert to efficiency score (0-100%, where lower CV = higher efficiency)
         efficiency = max(0, min(100, 100 - (cv * 100)))
@@ -505,22 +460,33 @@ class RedEnergyEfficiencySensor(RedEnergyBaseSensor):
     @property
     def extra_state_attributes(self) -> Optional[dict[str, Any]]:
         """Return extra state attributes."""
-        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
-        if not service_data or "usage_data" not in service_data:
-            return None
-
-        usage_data = service_data["usage_data"].get("usage_data", [])
-        if not usage_data:
+        stats = self.coordinator.get_usage_statistics(self._property_id, self._service_type)
+        if not stats or not stats["count"]:
             return None
 
-        usage_values = [entry.get("usage", 0) for entry in usage_data]
-        mean_usage = sum(usage_values) / len(usage_values) if usage_values else 0
+        service_data = self.coordinator.get_service_usage(self._property_id, self._service_type)
+        native_value = self._efficiency(stats)
 
         return {
             "consumer_number": service_data.get("consumer_number"),
-            "mean_daily_usage": round(mean_usage, 2),
-            "usage_variation": "Low" if self.native_value and self.native_value > 80 else
-                             "Medium" if self.native_value and self.native_value > 60 else "High",
-            "calculation_days": len(usage_data),
+            "mean_daily_usage": round(stats["mean"], 2),
+            "usage_variation": "Low" if native_value and native_value > 80 else
+                             "Medium" if native_value and native_value > 60 else "High",
+            "calculation_days": stats["count"],
             "service_type": self._service_type,
         }
+
+
+# Core sensors are always created; advanced sensors are optional
+CORE_SENSOR_CLASSES: tuple[type[RedEnergyBaseSensor], ...] = (
+    RedEnergyUsageSensor,
+    RedEnergyCostSensor,
+    RedEnergyCostPerUnitSensor,
+    RedEnergyTotalUsageSensor,
+)
+ADVANCED_SENSOR_CLASSES: tuple[type[RedEnergyBaseSensor], ...] = (
+    RedEnergyDailyAverageSensor,
+    RedEnergyMonthlyAverageSensor,
+    RedEnergyPeakUsageSensor,
+    RedEnergyEfficiencySensor,
+)
@@ -1,6 +1,7 @@
 """Red Energy integration services."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -8,7 +9,7 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN
+from .const import DATA_ENTRIES_BY_USERNAME, DOMAIN
 from .coordinator import RedEnergyDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +29,60 @@ SERVICE_EXPORT_DATA_SCHEMA = vol.Schema({
 })
 
 
+def _find_coordinator_by_username(
+    hass: HomeAssistant, username: str
+) -> RedEnergyDataCoordinator | None:
+    """Return the coordinator of the config entry set up for a username."""
+    entries = hass.data[DOMAIN]
+    entry_id = hass.data.get(DATA_ENTRIES_BY_USERNAME, {}).get(username)
+    entry_data = entries.get(entry_id)
+    if entry_data and entry_data.get("coordinator"):
+        return entry_data["coordinator"]
+
+    # Fall back to a scan in case the index is missing the entry
+    for entry_data in entries.values():
+        coordinator = entry_data.get("coordinator")
+        if coordinator and coordinator.username == username:
+            return coordinator
+
+    return None
+
+
+def _build_export(coordinator_data: dict[str, Any], days: int) -> dict[str, Any]:
+    """Build the export of one coordinator's data."""
+    # Extract relevant data for export
+    export_data = {
+        "customer": coordinator_data.get("customer", {}),
+        "properties": [],
+        "usage_summary": {}
+    }
+
+    # Add property and usage data
+    for prop_id, prop_data in coordinator_data.get("usage_data", {}).items():
+        property_info = prop_data.get("property", {})
+        export_data["properties"].append({
+            "id": prop_id,
+            "name": property_info.get("name"),
+            "address": property_info.get("address", {}),
+        })
+
+        # Add usage data for each service
+        services_data = {}
+        for service_type, service_data in prop_data.get("services", {}).items():
+            usage_info = service_data.get("usage_data", {})
+            services_data[service_type] = {
+                "total_usage": usage_info.get("total_usage"),
+                "total_cost": usage_info.get("total_cost"),
+                "from_date": usage_info.get("from_date"),
+                "to_date": usage_info.get("to_date"),
+                "daily_data": usage_info.get("usage_data", [])[:days]  # Limit to requested days
+            }
+
+        export_data["usage_summary"][prop_id] = services_data
+
+    return export_data
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Red Energy integration."""
 
@@ -35,16 +90,25 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         """Service call to manually refresh data for all coordinators."""
         _LOGGER.info("Manual data refresh requested")
 
+        coordinators: list[tuple[str, RedEnergyDataCoordinator]] = [
+            (entry_id, entry_data["coordinator"])
+            for entry_id, entry_data in hass.data[DOMAIN].items()
+            if entry_data.get("coordinator")
+        ]
+
+        # Coordinators fetch from the API independently, so refresh them concurrently
+        results = await asyncio.gather(
+            *(coordinator.async_refresh() for _, coordinator in coordinators),
+            return_exceptions=True,
+        )
+
         refresh_count = 0
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            coordinator: RedEnergyDataCoordinator = entry_data.get("coordinator")
-            if coordinator:
-                try:
-                    await coordinator.async_refresh()
-                    refresh_count += 1
-                    _LOGGER.debug("Refreshed data for coordinator %s", entry_id)
-                except Exception as err:
-                    _LOGGER.error("Failed to refresh coordinator %s: %s", entry_id, err)
+        for (entry_id, _), result in zip(coordinators, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Failed to refresh coordinator %s: %s", entry_id, result)
+            else:
+                refresh_count += 1
+                _LOGGER.debug("Refreshed data for coordinator %s", entry_id)
 
         _LOGGER.info("Completed manual refresh for %d coordinators", refresh_count)
 
@@ -57,22 +121,21 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         _LOGGER.info("Credential update requested for user %s", username)
 
         # Find coordinator matching the username
+        coordinator = _find_coordinator_by_username(hass, username)
+
         updated = False
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            coordinator: RedEnergyDataCoordinator = entry_data.get("coordinator")
-            if coordinator and coordinator.username == username:
-                try:
-                    success = await coordinator.async_refresh_credentials(
-                        username, password, client_id
-                    )
-                    if success:
-                        _LOGGER.info("Successfully updated credentials for %s", username)
-                        updated = True
-                    else:
-                        _LOGGER.error("Failed to validate new credentials for %s", username)
-                except Exception as err:
-                    _LOGGER.error("Error updating credentials for %s: %s", username, err)
-                break
+        if coordinator:
+            try:
+                success = await coordinator.async_refresh_credentials(
+                    username, password, client_id
+                )
+                if success:
+                    _LOGGER.info("Successfully updated credentials for %s", username)
+                    updated = True
+                else:
+                    _LOGGER.error("Failed to validate new credentials for %s", username)
+            except Exception as err:
+                _LOGGER.error("Error updating credentials for %s: %s", username, err)
 
         if not updated:
             _LOGGER.warning("No matching coordinator found for username %s", username)
@@ -84,41 +147,20 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         _LOGGER.info("Data export requested: format=%s, days=%d", export_format, days)
 
-        all_data = {}
-        for entry_id, entry_data in hass.data[DOMAIN].items():
-            coordinator: RedEnergyDataCoordinator = entry_data.get("coordinator")
-            if coordinator and coordinator.data:
-                # Extract relevant data for export
-                export_data = {
-                    "customer": coordinator.data.get("customer", {}),
-                    "properties": [],
-                    "usage_summary": {}
-                }
-
-                # Add property and usage data
-                for prop_id, prop_data in coordinator.data.get("usage_data", {}).items():
-                    property_info = prop_data.get("property", {})
-                    export_data["properties"].append({
-                        "id": prop_id,
-                        "name": property_info.get("name"),
-                        "address": property_info.get("address", {}),
-                    })
-
-                    # Add usage data for each service
-                    services_data = {}
-                    for service_type, service_data in prop_data.get("services", {}).items():
-                        usage_info = service_data.get("usage_data", {})
-                        services_data[service_type] = {
-                            "total_usage": usage_info.get("total_usage"),
-                            "total_cost": usage_info.get("total_cost"),
-                            "from_date": usage_info.get("from_date"),
-                            "to_date": usage_info.get("to_date"),
-                            "daily_data": usage_info.get("usage_data", [])[:days]  # Limit to requested days
-                        }
-
-                    export_data["usage_summary"][prop_id] = services_data
-
-                all_data[entry_id] = export_data
+        entries = [
+            (entry_id, entry_data["coordinator"].data)
+            for entry_id, entry_data in hass.data[DOMAIN].items()
+            if entry_data.get("coordinator") and entry_data["coordinator"].data
+        ]
+
+        # Assembling the export walks every daily entry, so keep it off the event loop
+        exports = await asyncio.gather(
+            *(
+                hass.async_add_executor_job(_build_export, coordinator_data, days)
+                for _, coordinator_data in entries
+            )
+        )
+        all_data = {entry_id: export for (entry_id, _), export in zip(entries, exports)}
 
         # Store exported data as a persistent notification
         # In a real implementation, this could write to a file or send via webhook
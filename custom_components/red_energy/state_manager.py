@@ -4,8 +4,9 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Set
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State
@@ -22,6 +23,45 @@ STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}_entity_states"
 
 
+class HistoryEntry(NamedTuple):
+    """A recorded entity state, stored as [state, ts, key_attributes]."""
+
+    state: str
+    ts: float
+    key_attributes: Dict[str, Any]
+
+
+def _load_history_entry(raw: Any) -> Optional[HistoryEntry]:
+    """Return a history entry from its stored form, or None if unreadable."""
+    if isinstance(raw, dict):
+        # Saved before entries were stored as arrays
+        timestamp = _entry_timestamp(raw, "ts", "timestamp")
+        if timestamp is None:
+            return None
+        return HistoryEntry(raw.get("state"), timestamp, raw.get("key_attributes", {}))
+
+    try:
+        state, timestamp, key_attributes = raw
+    except (TypeError, ValueError):
+        return None
+    return HistoryEntry(state, timestamp, key_attributes)
+
+
+def _entry_timestamp(entry: Dict[str, Any], ts_key: str, iso_key: str) -> Optional[float]:
+    """Return the epoch timestamp of a stored entry.
+
+    Entries saved before epoch timestamps were recorded only carry the ISO
+    string, which is parsed as a fallback.
+    """
+    timestamp = entry.get(ts_key)
+    if timestamp is not None:
+        return timestamp
+    try:
+        return datetime.fromisoformat(entry[iso_key]).timestamp()
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
 class RedEnergyStateManager:
     """Manage entity state persistence and restoration."""
 
@@ -31,8 +71,10 @@ class RedEnergyStateManager:
         self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._entity_states: Dict[str, Dict[str, Any]] = {}
         self._restoration_data: Dict[str, Any] = {}
-        self._state_history: Dict[str, List[Dict[str, Any]]] = {}
+        self._state_history: Dict[str, Deque[HistoryEntry]] = {}
         self._max_history_entries = 100
+        # Whether states changed since they were last loaded or saved
+        self._dirty = False
 
     async def async_load_states(self) -> None:
         """Load saved states from storage."""
@@ -41,7 +83,13 @@ class RedEnergyStateManager:
             if data:
                 self._entity_states = data.get("entity_states", {})
                 self._restoration_data = data.get("restoration_data", {})
-                self._state_history = data.get("state_history", {})
+                self._state_history = {
+                    entity_id: deque(
+                        filter(None, map(_load_history_entry, history)),
+                        maxlen=self._max_history_entries,
+                    )
+                    for entity_id, history in data.get("state_history", {}).items()
+                }
                 _LOGGER.debug("Loaded %d entity states from storage", len(self._entity_states))
         except Exception as err:
             _LOGGER.error("Failed to load entity states: %s", err)
@@ -55,15 +103,25 @@ class RedEnergyStateManager:
             # Clean up old history entries before saving
             self._cleanup_old_history()
 
+            if not self._dirty:
+                _LOGGER.debug("Entity states unchanged, skipping save")
+                return
+
+            # Cleared before the write so changes made while it runs are kept
+            self._dirty = False
             data = {
                 "entity_states": self._entity_states,
                 "restoration_data": self._restoration_data,
-                "state_history": self._state_history,
+                "state_history": {
+                    entity_id: list(history)
+                    for entity_id, history in self._state_history.items()
+                },
                 "last_saved": dt_util.utcnow().isoformat()
             }
             await self._store.async_save(data)
             _LOGGER.debug("Saved %d entity states to storage", len(self._entity_states))
         except Exception as err:
+            self._dirty = True
             _LOGGER.error("Failed to save entity states: %s", err)
 
     def record_entity_state(
@@ -74,30 +132,25 @@ class RedEnergyStateManager:
     ) -> None:
         """Record entity state for restoration."""
         now = dt_util.utcnow()
+        self._dirty = True
 
         # Store current state
         self._entity_states[entity_id] = {
             "state": state,
             "attributes": dict(attributes),
             "last_updated": now.isoformat(),
+            "last_updated_ts": now.timestamp(),
             "domain": entity_id.split('.')[0]
         }
 
-        # Add to history
-        if entity_id not in self._state_history:
-            self._state_history[entity_id] = []
-
-        history_entry = {
-            "state": state,
-            "timestamp": now.isoformat(),
-            "key_attributes": self._extract_key_attributes(attributes)
-        }
-
-        self._state_history[entity_id].append(history_entry)
+        # Add to history; the deque drops the oldest entries beyond the limit
+        history = self._state_history.get(entity_id)
+        if history is None:
+            history = self._state_history[entity_id] = deque(maxlen=self._max_history_entries)
 
-        # Limit history size
-        if len(self._state_history[entity_id]) > self._max_history_entries:
-            self._state_history[entity_id] = self._state_history[entity_id][-self._max_history_entries:]
+        history.append(
+            HistoryEntry(state, now.timestamp(), self._extract_key_attributes(attributes))
+        )
 
     def _extract_key_attributes(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Extract key attributes for history tracking."""
@@ -124,12 +177,11 @@ class RedEnergyStateManager:
         entity_data = self._entity_states[entity_id]
 
         # Check if data is too old (older than 7 days)
-        try:
-            last_updated = datetime.fromisoformat(entity_data["last_updated"])
-            if dt_util.utcnow() - last_updated > timedelta(days=7):
-                _LOGGER.debug("Restoration data for %s is too old, ignoring", entity_id)
-                return None
-        except (ValueError, KeyError):
+        last_updated = _entry_timestamp(entity_data, "last_updated_ts", "last_updated")
+        if last_updated is None:
+            return None
+        if last_updated < (dt_util.utcnow() - timedelta(days=7)).timestamp():
+            _LOGGER.debug("Restoration data for %s is too old, ignoring", entity_id)
             return None
 
         return {
@@ -146,18 +198,17 @@ class RedEnergyStateManager:
         if entity_id not in self._state_history:
             return []
 
-        cutoff_time = dt_util.utcnow() - timedelta(hours=hours)
-        recent_history = []
+        cutoff_ts = (dt_util.utcnow() - timedelta(hours=hours)).timestamp()
 
-        for entry in self._state_history[entity_id]:
-            try:
-                entry_time = datetime.fromisoformat(entry["timestamp"])
-                if entry_time >= cutoff_time:
-                    recent_history.append(entry)
-            except (ValueError, KeyError):
-                continue
-
-        return recent_history
+        return [
+            {
+                "state": entry.state,
+                "timestamp": dt_util.utc_from_timestamp(entry.ts).isoformat(),
+                "key_attributes": entry.key_attributes,
+            }
+            for entry in self._state_history[entity_id]
+            if entry.ts >= cutoff_ts
+        ]
 
     async def async_restore_entity_states(
         self,
@@ -165,25 +216,35 @@ class RedEnergyStateManager:
     ) -> Dict[str, bool]:
         """Restore states for multiple entities."""
         restoration_results = {}
+        entity_states = self._entity_states
+        set_state = self.hass.states.async_set
+        # Same 7 day limit as get_restoration_data, computed once for all entities
+        cutoff_ts = (dt_util.utcnow() - timedelta(days=7)).timestamp()
 
         for entity_id in entity_ids:
+            entity_data = entity_states.get(entity_id)
+            if entity_data is None:
+                restoration_results[entity_id] = False
+                continue
+
+            last_updated = _entry_timestamp(entity_data, "last_updated_ts", "last_updated")
+            if last_updated is None or last_updated < cutoff_ts:
+                restoration_results[entity_id] = False
+                continue
+
             try:
-                restoration_data = self.get_restoration_data(entity_id)
-                if restoration_data:
-                    # Set the restored state
-                    self.hass.states.async_set(
-                        entity_id,
-                        restoration_data["state"],
-                        restoration_data["attributes"]
-                    )
-                    restoration_results[entity_id] = True
-                    _LOGGER.debug("Restored state for %s", entity_id)
-                else:
-                    restoration_results[entity_id] = False
+                # Set the restored state
+                set_state(entity_id, entity_data["state"], entity_data["attributes"])
+                restoration_results[entity_id] = True
             except Exception as err:
                 _LOGGER.error("Failed to restore state for %s: %s", entity_id, err)
                 restoration_results[entity_id] = False
 
+        _LOGGER.debug(
+            "Restored states for %d of %d entities",
+            sum(restoration_results.values()),
+            len(entity_ids),
+        )
         return restoration_results
 
     def mark_entity_for_restoration(
@@ -192,6 +253,7 @@ class RedEnergyStateManager:
         restoration_strategy: str = "last_known"
     ) -> None:
         """Mark entity for specific restoration strategy."""
+        self._dirty = True
         self._restoration_data[entity_id] = {
             "strategy": restoration_strategy,
             "marked_at": dt_util.utcnow().isoformat()
@@ -199,25 +261,23 @@ class RedEnergyStateManager:
 
     def _cleanup_old_history(self) -> None:
         """Clean up old history entries."""
-        cutoff_time = dt_util.utcnow() - timedelta(days=30)
+        cutoff_ts = (dt_util.utcnow() - timedelta(days=30)).timestamp()
         entities_to_clean = []
 
         for entity_id, history in self._state_history.items():
-            cleaned_history = []
-            for entry in history:
-                try:
-                    entry_time = datetime.fromisoformat(entry["timestamp"])
-                    if entry_time >= cutoff_time:
-                        cleaned_history.append(entry)
-                except (ValueError, KeyError):
-                    continue
-
-            if cleaned_history:
-                self._state_history[entity_id] = cleaned_history
-            else:
+            cleaned_history = [entry for entry in history if entry.ts >= cutoff_ts]
+
+            if not cleaned_history:
                 entities_to_clean.append(entity_id)
+            elif len(cleaned_history) != len(history):
+                self._dirty = True
+                self._state_history[entity_id] = deque(
+                    cleaned_history, maxlen=self._max_history_entries
+                )
 
         # Remove entities with no recent history
+        if entities_to_clean:
+            self._dirty = True
         for entity_id in entities_to_clean:
             del self._state_history[entity_id]
             if entity_id in self._entity_states:
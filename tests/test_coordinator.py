@@ -202,4 +202,41 @@ def test_file_count():
         assert expected in python_files, f"Missing expected file: {expected}"
     
     # We should have at least 9 Python files
-    assert len(python_files) >= 9, f"Expected at least 9 Python files, found {len(python_files)}: {python_files}"
\ No newline at end of file
+    assert len(python_files) >= 9, f"Expected at least 9 Python files, found {len(python_files)}: {python_files}"
+
+def test_build_dataset_reuses_unchanged_data():
+    """Test that polls differing only in fetch timestamps reuse the dataset."""
+    from custom_components.red_energy.coordinator import RedEnergyDataCoordinator
+
+    def usage(total, fetched_at):
+        return {
+            "p1": {
+                "property": {"id": "p1", "name": "Home"},
+                "services": {
+                    "electricity": {
+                        "consumer_number": "c1",
+                        "usage_data": {"total_usage": total, "usage_data": []},
+                        "last_updated": fetched_at,
+                    }
+                },
+            }
+        }
+
+    coordinator = object.__new__(RedEnergyDataCoordinator)
+    coordinator.data = None
+    coordinator.data_revision = 0
+    coordinator._customer_data = {"id": "customer"}
+    coordinator._properties = [{"id": "p1"}]
+
+    first = coordinator._build_dataset(usage(10.0, "2025-09-01T10:00:00"))
+    coordinator.data = first
+    assert coordinator.data_revision == 1
+
+    # Same usage, new fetch timestamp: the current dataset is returned as-is
+    assert coordinator._build_dataset(usage(10.0, "2025-09-01T10:05:00")) is first
+    assert coordinator.data_revision == 1
+
+    changed = coordinator._build_dataset(usage(12.5, "2025-09-01T10:10:00"))
+    assert changed is not first
+    assert changed["usage_data"]["p1"]["services"]["electricity"]["usage_data"]["total_usage"] == 12.5
+    assert coordinator.data_revision == 2
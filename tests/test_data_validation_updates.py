@@ -10,6 +10,7 @@ from custom_components.red_energy.data_validation import (
     validate_single_property,
     validate_usage_data,
     validate_address,
+    clear_validation_cache,
     DataValidationError,
 )
 
@@ -51,6 +52,39 @@ class TestCustomerDataValidation:
             validate_customer_data(raw_data)
 
 
+class TestValidationCache:
+    """Test memoization of validated customer/properties payloads."""
+
+    def setup_method(self):
+        """Start each test with an empty cache."""
+        clear_validation_cache()
+
+    def test_unchanged_properties_payload_is_cached(self):
+        """Test identical property payloads reuse the validated result."""
+        raw_data = [{"propertyPhysicalNumber": 1, "accountNumber": 2, "consumers": []}]
+
+        first = validate_properties_data(raw_data)
+        second = validate_properties_data([dict(raw_data[0])])
+
+        assert first is second
+
+    def test_changed_properties_payload_is_revalidated(self):
+        """Test a changed payload misses the cache."""
+        first = validate_properties_data([{"propertyPhysicalNumber": 1, "consumers": []}])
+        second = validate_properties_data([{"propertyPhysicalNumber": 3, "consumers": []}])
+
+        assert first is not second
+        assert second[0]["id"] == "3"
+
+    def test_customer_validation_errors_are_not_cached(self):
+        """Test failed validations raise on every call."""
+        raw_data = {"name": "Test", "email": "test@example.com", "accounts": []}
+
+        for _ in range(2):
+            with pytest.raises(DataValidationError):
+                validate_customer_data(dict(raw_data))
+
+
 class TestPropertyDataValidation:
     """Test property data validation with new field mappings."""
 
@@ -313,6 +347,21 @@ class TestUsageDataValidation:
         assert result["total_cost"] == 0.0
 
 
+    def test_validate_usage_data_skips_malformed_entries(self):
+        """Test malformed entries are skipped without failing the batch."""
+        raw_data = [
+            "not-a-dict",
+            {"usageDate": "2025-08-08", "halfHours": [{"consumptionKwh": "bad"}]},
+            {"usageDate": "2025-08-09", "halfHours": [{"consumptionKwh": 0.5, "consumptionDollarIncGst": None}]},
+        ]
+
+        result = validate_usage_data(raw_data, "4373002210")
+
+        assert len(result["usage_data"]) == 1
+        assert result["from_date"] == "2025-08-09"
+        assert result["usage_data"][0]["usage"] == 0.5
+        assert result["usage_data"][0]["cost"] == 0.0
+
 class TestIntegrationWithRealData:
     """Test integration with real API data structure."""
 
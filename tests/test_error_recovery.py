@@ -0,0 +1,211 @@
+"""Test the Red Energy error recovery system."""
+from __future__ import annotations
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from custom_components.red_energy.error_recovery import (
+    CircuitBreaker,
+    ErrorSeverity,
+    ErrorType,
+    RecoveryAction,
+    RecoveryStrategy,
+    RedEnergyErrorRecoverySystem,
+)
+
+
+@pytest.fixture
+def recovery_system():
+    """Return an error recovery system with a mocked store."""
+    system = RedEnergyErrorRecoverySystem(MagicMock())
+    system._store = MagicMock()
+    return system
+
+
+@pytest.mark.asyncio
+async def test_handle_error_debounces_storage_writes(recovery_system):
+    """Test that error bursts schedule a delayed save instead of writing inline."""
+    for _ in range(60):
+        await recovery_system.async_handle_error(ValueError("boom"), ErrorType.UNKNOWN)
+
+    assert recovery_system._store.async_delay_save.call_count == 60
+    recovery_system._store.async_save.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_save_data_drops_unserializable_context(recovery_system):
+    """Test that live objects in the error context are not persisted."""
+    await recovery_system.async_handle_error(
+        ValueError("boom"),
+        ErrorType.UNKNOWN,
+        {"coordinator": object(), "property_id": "123"},
+    )
+
+    data = recovery_system._build_save_data()
+
+    assert data["error_history"][0]["context"] == {"property_id": "123"}
+    assert data["error_counts"] == {ErrorType.UNKNOWN: 1}
+
+
+@pytest.mark.asyncio
+async def test_save_data_keeps_last_100_errors(recovery_system):
+    """Test that the stored history is capped and reflects recovery results."""
+    for index in range(120):
+        await recovery_system.async_handle_error(
+            ValueError(f"boom {index}"), ErrorType.UNKNOWN, {"component": str(index)}
+        )
+
+    history = recovery_system._build_save_data()["error_history"]
+
+    assert len(history) == 100
+    assert history[0]["message"] == "boom 20"
+    assert history[-1]["message"] == "boom 119"
+    assert history[-1]["resolved"] is False
+
+
+@pytest.mark.asyncio
+async def test_recent_error_count_expires(recovery_system):
+    """Test that errors older than 24 hours drop out of the recent count."""
+    with patch(
+        "custom_components.red_energy.error_recovery.time.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        await recovery_system.async_handle_error(ValueError("old"), ErrorType.UNKNOWN)
+
+        mock_monotonic.return_value = 1000.0 + 86400 + 1
+        await recovery_system.async_handle_error(ValueError("new"), ErrorType.UNKNOWN)
+
+        stats = recovery_system.get_error_statistics()
+
+    assert stats["total_errors"] == 2
+    assert stats["recent_errors_24h"] == 1
+
+
+@pytest.mark.asyncio
+async def test_resolved_counts_follow_history(recovery_system):
+    """Test that resolved counts track records evicted from the history."""
+    with patch.object(
+        recovery_system, "_attempt_recovery", AsyncMock(return_value=True)
+    ):
+        for index in range(1000):
+            await recovery_system.async_handle_error(
+                ValueError("boom"), ErrorType.UNKNOWN, {"component": str(index)}
+            )
+
+    for _ in range(10):
+        await recovery_system.async_handle_error(ValueError("boom"), ErrorType.UNKNOWN)
+
+    stats = recovery_system.get_error_statistics()
+    assert stats["total_errors"] == 1000
+    assert stats["resolved_errors"] == 990
+    assert stats["unresolved_errors"] == 10
+
+
+@pytest.mark.parametrize(
+    ("message", "error_type", "severity"),
+    [
+        ("Invalid TOKEN", ErrorType.NETWORK_TIMEOUT, ErrorSeverity.CRITICAL),
+        ("bad config", ErrorType.CONFIG_INVALID, ErrorSeverity.HIGH),
+        ("refused", ErrorType.API_CONNECTION, ErrorSeverity.MEDIUM),
+        ("slow down", ErrorType.API_RATE_LIMIT, ErrorSeverity.LOW),
+        ("boom", ErrorType.UNKNOWN, ErrorSeverity.MEDIUM),
+    ],
+)
+def test_classify_error_severity(recovery_system, message, error_type, severity):
+    """Test error severity classification."""
+    assert recovery_system._classify_error_severity(message, error_type) is severity
+
+
+def test_circuit_breaker_half_opens_after_timeout():
+    """Test that an open circuit breaker half-opens after its timeout."""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=300)
+
+    with patch(
+        "custom_components.red_energy.error_recovery.time.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        breaker.record_failure()
+        assert not breaker.is_open()
+        breaker.record_failure()
+        assert breaker.is_open()
+        assert breaker.last_failure_time is not None
+
+        mock_monotonic.return_value = 1301.0
+        assert not breaker.is_open()
+        assert breaker.get_state() == "HALF_OPEN"
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_states_keyed_by_type_and_component(recovery_system):
+    """Test that circuit breakers are reported per error type and component."""
+    await recovery_system.async_handle_error(
+        ValueError("boom"), ErrorType.UNKNOWN, {"component": "sensor"}
+    )
+    await recovery_system.async_handle_error(ValueError("boom"), ErrorType.UNKNOWN)
+
+    states = recovery_system.get_error_statistics()["circuit_breaker_states"]
+
+    assert set(states) == {"unknown_sensor", "unknown_unknown"}
+    assert states["unknown_sensor"]["failure_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_load_error_data_restores_counts(recovery_system):
+    """Test that stored error counts are restored by error type."""
+    recovery_system._store.async_load = AsyncMock(
+        return_value={"error_counts": {"network_timeout": 4, "retired_type": 2}}
+    )
+
+    await recovery_system.async_load_error_data()
+    await recovery_system.async_handle_error(ValueError("slow"), ErrorType.NETWORK_TIMEOUT)
+
+    assert recovery_system.get_error_statistics()["error_counts_by_type"] == {
+        ErrorType.NETWORK_TIMEOUT: 5
+    }
+
+
+@pytest.mark.asyncio
+async def test_handled_error_releases_exception(recovery_system):
+    """Test that handled error records do not keep the exception alive."""
+    await recovery_system.async_handle_error(ValueError("boom"), ErrorType.UNKNOWN)
+
+    error_record = recovery_system._error_history[-1]
+    assert error_record.exception is None
+    assert error_record.message == "boom"
+
+
+@pytest.mark.asyncio
+async def test_each_recovery_action_gets_its_own_attempts(recovery_system):
+    """Test that a failing retry no longer uses up the fallback's attempts."""
+    retry = AsyncMock(return_value=False)
+    fallback = AsyncMock(return_value=True)
+    recovery_system._recovery_actions[ErrorType.UNKNOWN] = [
+        RecoveryAction(RecoveryStrategy.RETRY, retry, max_attempts=2, delay=1.0),
+        RecoveryAction(RecoveryStrategy.FALLBACK, fallback, max_attempts=1),
+    ]
+
+    with patch(
+        "custom_components.red_energy.error_recovery.asyncio.sleep"
+    ) as mock_sleep:
+        assert await recovery_system.async_handle_error(ValueError("boom"), ErrorType.UNKNOWN)
+
+    assert retry.await_count == 2
+    fallback.assert_awaited_once()
+    mock_sleep.assert_awaited_once_with(2.0)
+    assert recovery_system._error_history[-1].recovery_attempts == 3
+
+
+def test_default_recovery_actions_built_on_first_use(recovery_system):
+    """Test that default recovery actions are only built when needed."""
+    assert recovery_system._recovery_actions == {}
+
+    actions = recovery_system._get_recovery_actions(ErrorType.API_CONNECTION)
+
+    assert [action.strategy for action in actions] == [
+        RecoveryStrategy.RETRY,
+        RecoveryStrategy.FALLBACK,
+    ]
+    assert actions[0].action == recovery_system._retry_api_connection
+    assert (actions[0].max_attempts, actions[0].delay) == (3, 10.0)
+    assert recovery_system._get_recovery_actions(ErrorType.API_CONNECTION) is actions
+    assert recovery_system._get_recovery_actions(ErrorType.UNKNOWN) == []
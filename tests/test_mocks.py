@@ -1,6 +1,7 @@
 """Test mocking utilities for Red Energy integration."""
 from __future__ import annotations
 
+from copy import deepcopy
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock, MagicMock
@@ -69,7 +70,8 @@ class MockRedEnergyAPI:
     
     async def get_properties(self) -> List[Dict[str, Any]]:
         """Get mock properties."""
-        return self.mock_properties.copy()
+        # Nested address/service dicts must not be shared with callers
+        return deepcopy(self.mock_properties)
     
     async def get_usage_data(
         self,
@@ -78,31 +80,38 @@ class MockRedEnergyAPI:
         to_date: datetime
     ) -> Dict[str, Any]:
         """Get mock usage data."""
-        # Generate mock daily usage data
-        current_date = from_date
+        # Generate mock daily usage data, totalling as we go
+        is_electricity = "elec" in consumer_number
+        base_usage = 25 if is_electricity else 45
+        unit = "kWh" if is_electricity else "MJ"
         usage_data = []
+        total_usage = 0
+        total_cost = 0.0
         
-        while current_date <= to_date:
-            # Mock usage values
-            base_usage = 25 if "elec" in consumer_number else 45
-            daily_usage = base_usage + (hash(current_date.strftime("%Y%m%d")) % 20)
+        for day in range((to_date - from_date).days + 1):
+            current_date = from_date + timedelta(days=day)
+            # Knuth multiplicative hash: deterministic across runs, no strftime
+            daily_usage = base_usage + (
+                ((current_date.toordinal() * 2654435761) & 0x7FFFFFFF) % 20
+            )
+            daily_cost = daily_usage * 0.28
+            total_usage += daily_usage
+            total_cost += daily_cost
             
             usage_data.append({
                 "date": current_date.strftime("%Y-%m-%d"),
                 "usage": daily_usage,
-                "cost": daily_usage * 0.28,
-                "unit": "kWh" if "elec" in consumer_number else "MJ"
+                "cost": daily_cost,
+                "unit": unit
             })
-            
-            current_date += timedelta(days=1)
         
         return {
             "consumer_number": consumer_number,
             "from_date": from_date.strftime("%Y-%m-%d"),
             "to_date": to_date.strftime("%Y-%m-%d"),
             "usage_data": usage_data,
-            "total_usage": sum(d["usage"] for d in usage_data),
-            "total_cost": sum(d["cost"] for d in usage_data)
+            "total_usage": total_usage,
+            "total_cost": total_cost
         }
 
 
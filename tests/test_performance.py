@@ -0,0 +1,282 @@
+"""Test Red Energy performance utilities."""
+from __future__ import annotations
+
+import asyncio
+import gc
+import weakref
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.red_energy.performance import (
+    BulkOperationManager,
+    DataProcessor,
+    MemoryOptimizer,
+    PROCESSED_CACHE_SIZE,
+    PerformanceMonitor,
+    _OperationStats,
+    _calculate_daily_stats,
+)
+
+
+@pytest.fixture
+def data_processor():
+    """Return a data processor with a real performance monitor."""
+    return DataProcessor(PerformanceMonitor(MagicMock()))
+
+
+def test_calculate_daily_stats():
+    """Test daily statistics of a usage series."""
+    stats = _calculate_daily_stats(
+        (("2025-01-01", 10.0), ("2025-01-02", 20.0), ("2025-01-03", 30.0))
+    )
+
+    assert stats["mean"] == 20.0
+    assert stats["std_dev"] == pytest.approx(8.16496580927726)
+    assert (stats["min"], stats["max"], stats["count"]) == (10.0, 30.0, 3)
+
+
+def test_daily_stats_cache_does_not_keep_processors_alive():
+    """Test that processing data does not pin the processor in a cache."""
+    data_processor = DataProcessor(PerformanceMonitor(MagicMock()))
+    usage_data = {
+        "prop-1": {
+            "services": {
+                "electricity": {
+                    "usage_data": {"usage_data": [{"date": "2025-01-01", "usage": 5.0}]}
+                }
+            }
+        }
+    }
+    data_processor.batch_process_properties(usage_data, ["prop-1"], ["electricity"])
+    processor_ref = weakref.ref(data_processor)
+
+    del data_processor
+    gc.collect()
+
+    assert processor_ref() is None
+
+
+def test_calculate_peak_usage(data_processor):
+    """Test that the first highest usage day is reported as the peak."""
+    daily_data = [
+        {"date": "2025-01-01", "usage": 5.0, "cost": 1.0},
+        {"date": "2025-01-02", "usage": 9.0, "cost": 2.5},
+        {"date": "2025-01-03"},
+        {"date": "2025-01-04", "usage": 9.0, "cost": 3.0},
+    ]
+
+    assert data_processor._calculate_peak_usage(daily_data) == {
+        "usage": 9.0,
+        "date": "2025-01-02",
+        "cost": 2.5,
+    }
+
+
+def test_compress_to_weekly_averages():
+    """Test that daily data is averaged per Monday-based week."""
+    daily_data = [
+        {"date": "2025-01-06", "usage": 10.0, "cost": 2.0},
+        {"date": "2025-01-07", "usage": 20.0, "cost": 4.0},
+        {"date": "2025-01-13", "usage": 7.0, "cost": 1.0},
+        {"date": "not-a-date", "usage": 99.0},
+        {"usage": 99.0},
+    ]
+
+    assert MemoryOptimizer()._compress_to_weekly_averages(daily_data) == [
+        {
+            "date": "2025-01-06",
+            "usage": 15.0,
+            "cost": 3.0,
+            "data_type": "weekly_average",
+            "days_included": 2,
+        },
+        {
+            "date": "2025-01-13",
+            "usage": 7.0,
+            "cost": 1.0,
+            "data_type": "weekly_average",
+            "days_included": 1,
+        },
+    ]
+
+
+def test_get_memory_usage_stats_handles_deep_nesting():
+    """Test memory statistics on shared and deeply nested structures."""
+    shared = {"usage": 1.0}
+    data = {"a": [shared, shared], "b": (1, 2)}
+    nested: list = []
+    for _ in range(5000):
+        nested = [nested]
+
+    stats = MemoryOptimizer().get_memory_usage_stats(data)
+    deep_stats = MemoryOptimizer().get_memory_usage_stats(nested)
+
+    # Objects are counted per reference: the shared dict and its value twice
+    assert stats["object_count"] == 9
+    assert stats["total_bytes"] > 0
+    assert deep_stats["object_count"] == 5001
+
+
+@pytest.mark.asyncio
+async def test_time_operation_reports_seconds():
+    """Test that timed operations are reported in seconds."""
+    monitor = PerformanceMonitor(MagicMock())
+
+    @monitor.time_operation("fetch")
+    async def fetch():
+        return "ok"
+
+    @monitor.time_operation("fail")
+    async def fail():
+        raise ValueError("boom")
+
+    assert await fetch() == "ok"
+    with pytest.raises(ValueError):
+        await fail()
+
+    timing_stats = monitor.get_performance_stats()["timing_stats"]
+    assert set(timing_stats) == {"fetch", "fail_error"}
+    assert timing_stats["fetch"]["count"] == 1
+    assert 0 <= timing_stats["fetch"]["max_time"] < 1
+
+
+def test_operation_stats_running_aggregates():
+    """Test running timing aggregates."""
+    stats = _OperationStats()
+    for duration in (30, 10, 20, *([40] * 10)):
+        stats.add(duration)
+
+    assert stats.count == 13
+    assert stats.total_ns == 460
+    assert (stats.min_ns, stats.max_ns) == (10, 40)
+    assert list(stats.recent) == [40] * 10
+
+
+@pytest.mark.asyncio
+async def test_bulk_refresh_limits_concurrency():
+    """Test that coordinators refresh concurrently up to the batch size."""
+    running = 0
+    peak = 0
+
+    async def refresh():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    coordinators = []
+    for index in range(5):
+        coordinator = MagicMock(username=f"user{index}")
+        coordinator.async_refresh = AsyncMock(side_effect=refresh)
+        coordinators.append(coordinator)
+    coordinators[2].async_refresh = AsyncMock(side_effect=RuntimeError("down"))
+
+    manager = BulkOperationManager(MagicMock(), PerformanceMonitor(MagicMock()))
+    results = await manager.async_bulk_refresh_coordinators(coordinators, batch_size=2)
+
+    assert results == {
+        "user0": True,
+        "user1": True,
+        "user2": False,
+        "user3": True,
+        "user4": True,
+    }
+    assert peak == 2
+
+
+def test_get_cached_calculation_expires(data_processor):
+    """Test that cached calculations are recomputed after the TTL."""
+    calculation = MagicMock(side_effect=[1, 2])
+
+    with patch(
+        "custom_components.red_energy.performance.time.monotonic"
+    ) as mock_monotonic:
+        mock_monotonic.return_value = 1000.0
+        assert data_processor.get_cached_calculation("key", calculation) == 1
+        mock_monotonic.return_value = 1299.0
+        assert data_processor.get_cached_calculation("key", calculation) == 1
+        mock_monotonic.return_value = 1301.0
+        assert data_processor.get_cached_calculation("key", calculation) == 2
+
+    assert calculation.call_count == 2
+
+
+def test_get_cached_calculation_evicts_least_recently_used(data_processor):
+    """Test that the calculation cache is bounded."""
+    for index in range(PROCESSED_CACHE_SIZE):
+        data_processor.get_cached_calculation(f"key{index}", lambda: index)
+    data_processor.get_cached_calculation("key0", lambda: -1)
+    data_processor.get_cached_calculation("extra", lambda: -1)
+
+    assert len(data_processor._processed_cache) == PROCESSED_CACHE_SIZE
+    assert "key0" in data_processor._processed_cache
+    assert "key1" not in data_processor._processed_cache
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_entities():
+    """Test that entity states are written in one pass, skipping failures."""
+    hass = MagicMock()
+    current = {
+        "sensor.a": MagicMock(state="1", attributes={"unit": "kWh"}),
+        "sensor.b": MagicMock(state="2", attributes={}),
+        "sensor.c": MagicMock(state="3", attributes={}),
+    }
+    hass.states.get.side_effect = current.get
+    hass.states.async_set.side_effect = [None, ValueError("bad"), None]
+
+    manager = BulkOperationManager(hass, PerformanceMonitor(MagicMock()))
+    updated = await manager.async_bulk_update_entities({
+        "sensor.a": {"state": "10"},
+        "sensor.b": {"state": "20"},
+        "sensor.missing": {"state": "0"},
+        "sensor.c": {"attributes": {"unit": "MJ"}},
+    })
+
+    assert updated == 2
+    hass.states.async_set.assert_any_call("sensor.a", "10", {"unit": "kWh"})
+    hass.states.async_set.assert_any_call("sensor.c", "3", {"unit": "MJ"})
+
+
+@pytest.mark.parametrize("advanced_sensors_enabled", [False, True])
+def test_optimize_sensor_calculations(data_processor, advanced_sensors_enabled):
+    """Test core and advanced sensor values from processed data."""
+    daily_data = [
+        {"date": "2025-01-01", "usage": 10.0, "cost": 2.0},
+        {"date": "2025-01-02", "usage": 20.0, "cost": 4.0},
+    ]
+    usage_data = {
+        "prop-1": {
+            "services": {
+                "electricity": {
+                    "usage_data": {
+                        "usage_data": daily_data,
+                        "total_usage": 30.0,
+                        "total_cost": 6.0,
+                    }
+                }
+            }
+        }
+    }
+    processed = data_processor.batch_process_properties(
+        usage_data, ["prop-1"], ["electricity"]
+    )
+
+    sensor_values = data_processor.optimize_sensor_calculations(
+        processed, advanced_sensors_enabled
+    )
+    values = sensor_values["prop-1"]["electricity"]
+
+    assert data_processor.build_sensor_values(
+        usage_data, ["prop-1", "prop-2"], ["electricity", "gas"], advanced_sensors_enabled
+    ) == sensor_values
+
+    assert values["daily_usage"] == 20.0
+    assert (values["total_usage"], values["total_cost"]) == (30.0, 6.0)
+    if advanced_sensors_enabled:
+        assert values["daily_average"] == 15.0
+        assert values["peak_usage"]["date"] == "2025-01-02"
+    else:
+        assert "daily_average" not in values
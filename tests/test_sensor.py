@@ -4,6 +4,7 @@ from __future__ import annotations
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timedelta
+from functools import partial
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfEnergy
@@ -107,6 +108,14 @@ def mock_coordinator():
     coordinator.get_total_usage = Mock(return_value=60.8)
     coordinator.get_service_usage = Mock(return_value=MOCK_USAGE_DATA["84953336"]["services"]["electricity"])
 
+    # Usage statistics are derived from the mocked service usage by the real implementation
+    coordinator.data_revision = 0
+    coordinator._usage_stats_revision = -1
+    coordinator._usage_stats = {}
+    coordinator.get_usage_statistics = partial(
+        RedEnergyDataCoordinator.get_usage_statistics, coordinator
+    )
+
     return coordinator
 
 
@@ -392,6 +401,23 @@ class TestRedEnergyPeakUsageSensor:
         # Peak usage should be 23.2 (highest value in test data)
         assert sensor.native_value == 23.2
 
+    def test_usage_statistics_shared_until_data_changes(self, mock_coordinator, mock_config_entry):
+        """Test that derived statistics are computed once per coordinator update."""
+        peak = RedEnergyPeakUsageSensor(mock_coordinator, mock_config_entry, "84953336", SERVICE_TYPE_ELECTRICITY)
+        average = RedEnergyDailyAverageSensor(mock_coordinator, mock_config_entry, "84953336", SERVICE_TYPE_ELECTRICITY)
+
+        assert peak.native_value == 23.2
+        assert average.native_value is not None
+        assert mock_coordinator.get_service_usage.call_count == 1
+
+        mock_coordinator.data_revision += 1
+        mock_coordinator.get_service_usage.return_value = {
+            "usage_data": {"usage_data": [{"date": "2025-09-01", "usage": 30.0}]}
+        }
+
+        assert peak.native_value == 30.0
+        assert mock_coordinator.get_service_usage.call_count == 2
+
 
 class TestRedEnergyEfficiencySensor:
     """Test the efficiency sensor."""
@@ -0,0 +1,134 @@
+"""Test the Red Energy services."""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.red_energy.const import DATA_ENTRIES_BY_USERNAME, DOMAIN
+from custom_components.red_energy.services import async_setup_services
+
+
+async def _get_service_handler(hass, service):
+    """Register the services on a mocked hass and return one handler."""
+    await async_setup_services(hass)
+    for call in hass.services.async_register.call_args_list:
+        if call.args[1] == service:
+            return call.args[2]
+    raise AssertionError(f"Service {service} was not registered")
+
+
+@pytest.fixture
+def hass():
+    """Return a mocked Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {DOMAIN: {}}
+    return hass
+
+
+@pytest.mark.asyncio
+async def test_refresh_data_refreshes_coordinators_concurrently(hass):
+    """Test that every coordinator refresh is in flight at the same time."""
+    started = []
+    release = asyncio.Event()
+
+    async def refresh(entry_id):
+        started.append(entry_id)
+        await release.wait()
+
+    for entry_id in ("entry_1", "entry_2", "entry_3"):
+        coordinator = MagicMock()
+        coordinator.async_refresh = partial(refresh, entry_id)
+        hass.data[DOMAIN][entry_id] = {"coordinator": coordinator}
+
+    handler = await _get_service_handler(hass, "refresh_data")
+    task = asyncio.ensure_future(handler(MagicMock()))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert sorted(started) == ["entry_1", "entry_2", "entry_3"]
+    release.set()
+    await task
+
+
+@pytest.mark.asyncio
+async def test_refresh_data_isolates_coordinator_failures(hass):
+    """Test that one failing coordinator doesn't stop the others."""
+    failing = MagicMock()
+    failing.async_refresh = AsyncMock(side_effect=RuntimeError("boom"))
+    working = MagicMock()
+    working.async_refresh = AsyncMock()
+    hass.data[DOMAIN] = {
+        "failing": {"coordinator": failing},
+        "working": {"coordinator": working},
+    }
+
+    handler = await _get_service_handler(hass, "refresh_data")
+    await handler(MagicMock())
+
+    failing.async_refresh.assert_awaited_once()
+    working.async_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_export_data_builds_exports_in_executor(hass):
+    """Test that exports are assembled in executor jobs and limited to the requested days."""
+    coordinator = MagicMock()
+    coordinator.data = {
+        "customer": {"id": "customer"},
+        "usage_data": {
+            "p1": {
+                "property": {"name": "Home", "address": {"postcode": "3000"}},
+                "services": {
+                    "electricity": {
+                        "usage_data": {
+                            "total_usage": 30.0,
+                            "usage_data": [{"date": f"2025-01-0{day}", "usage": 10.0} for day in (1, 2, 3)],
+                        }
+                    }
+                },
+            }
+        },
+    }
+    hass.data[DOMAIN]["entry_1"] = {"coordinator": coordinator}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda target, *args: target(*args))
+
+    handler = await _get_service_handler(hass, "export_data")
+    call = MagicMock()
+    call.data = {"format": "json", "days": 2}
+    await handler(call)
+
+    target, coordinator_data, days = hass.async_add_executor_job.await_args.args
+    export = target(coordinator_data, days)
+    assert export["properties"] == [{"id": "p1", "name": "Home", "address": {"postcode": "3000"}}]
+    daily_data = export["usage_summary"]["p1"]["electricity"]["daily_data"]
+    assert [entry["date"] for entry in daily_data] == ["2025-01-01", "2025-01-02"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_update_credentials_finds_coordinator_by_username(hass, indexed):
+    """Test that credentials are updated through the username index or a scan."""
+    other = MagicMock(username="other@example.com")
+    other.async_refresh_credentials = AsyncMock(return_value=True)
+    target = MagicMock(username="user@example.com")
+    target.async_refresh_credentials = AsyncMock(return_value=True)
+    hass.data[DOMAIN] = {
+        "entry_1": {"coordinator": other},
+        "entry_2": {"coordinator": target},
+    }
+    if indexed:
+        hass.data[DATA_ENTRIES_BY_USERNAME] = {
+            "other@example.com": "entry_1",
+            "user@example.com": "entry_2",
+        }
+
+    handler = await _get_service_handler(hass, "update_credentials")
+    call = MagicMock()
+    call.data = {"username": "user@example.com", "password": "new", "client_id": "client"}
+    await handler(call)
+
+    target.async_refresh_credentials.assert_awaited_once_with("user@example.com", "new", "client")
+    other.async_refresh_credentials.assert_not_awaited()
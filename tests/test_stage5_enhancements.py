@@ -247,7 +247,8 @@ def test_init_stage5_integration():
 
     # Check for cleanup integration
     assert "await state_manager.async_save_states()" in content
-    assert "await device_manager.async_cleanup_orphaned_entities()" in content
+    assert "device_manager.async_cleanup_orphaned_entities()" in content
+    assert "async_create_background_task" in content
 
 
 def test_performance_optimization_features():
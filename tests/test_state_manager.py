@@ -0,0 +1,146 @@
+"""Test the Red Energy state manager."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+
+from custom_components.red_energy.state_manager import RedEnergyStateManager
+
+
+@pytest.fixture
+def state_manager():
+    """Return a state manager with a mocked store."""
+    manager = RedEnergyStateManager(MagicMock())
+    manager._store = MagicMock()
+    return manager
+
+
+def test_record_entity_state_stores_epoch_timestamps(state_manager):
+    """Test that recorded states carry epoch timestamps next to ISO strings."""
+    state_manager.record_entity_state("sensor.usage", "12.5", {"icon": "mdi:flash"})
+
+    entity_data = state_manager._entity_states["sensor.usage"]
+    history_entry = state_manager._state_history["sensor.usage"][0]
+    assert isinstance(entity_data["last_updated_ts"], float)
+    assert isinstance(history_entry.ts, float)
+    assert history_entry.key_attributes == {"icon": "mdi:flash"}
+
+
+@pytest.mark.asyncio
+async def test_entity_history_loads_legacy_entries(state_manager):
+    """Test that history saved as dicts with ISO timestamps is still loaded."""
+    now = dt_util.utcnow()
+    state_manager._store.async_load = AsyncMock(return_value={
+        "state_history": {
+            "sensor.usage": [
+                {"state": "1", "timestamp": (now - timedelta(hours=48)).isoformat()},
+                {"state": "2", "timestamp": (now - timedelta(hours=1)).isoformat()},
+                {"state": "3", "timestamp": "not-a-timestamp"},
+                ["4", (now - timedelta(hours=2)).timestamp(), {"icon": "mdi:flash"}],
+            ]
+        }
+    })
+    await state_manager.async_load_states()
+    state_manager.record_entity_state("sensor.usage", "5", {})
+
+    history = state_manager.get_entity_history("sensor.usage", hours=24)
+
+    assert [entry["state"] for entry in history] == ["2", "4", "5"]
+    assert history[1]["key_attributes"] == {"icon": "mdi:flash"}
+    assert dt_util.parse_datetime(history[0]["timestamp"]) is not None
+
+
+def test_restoration_data_ignores_stale_states(state_manager):
+    """Test that restoration data older than a week is ignored."""
+    state_manager.record_entity_state("sensor.fresh", "5", {})
+    state_manager._entity_states["sensor.stale"] = {
+        "state": "6",
+        "attributes": {},
+        "last_updated": (dt_util.utcnow() - timedelta(days=8)).isoformat(),
+    }
+
+    assert state_manager.get_restoration_data("sensor.fresh") == {"state": "5", "attributes": {}}
+    assert state_manager.get_restoration_data("sensor.stale") is None
+    assert state_manager.get_restoration_data("sensor.missing") is None
+
+
+@pytest.mark.asyncio
+async def test_save_states_skips_unchanged_states(state_manager):
+    """Test that saves are skipped until a state changes."""
+    state_manager._store.async_save = AsyncMock()
+
+    await state_manager.async_save_states()
+    state_manager._store.async_save.assert_not_awaited()
+
+    state_manager.record_entity_state("sensor.usage", "12.5", {})
+    await state_manager.async_save_states()
+    await state_manager.async_save_states()
+    state_manager._store.async_save.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_save_states_retries_after_failed_save(state_manager):
+    """Test that a failed save leaves the states marked as changed."""
+    state_manager._store.async_save = AsyncMock(side_effect=[OSError("disk full"), None])
+    state_manager.record_entity_state("sensor.usage", "12.5", {})
+
+    await state_manager.async_save_states()
+    await state_manager.async_save_states()
+
+    assert state_manager._store.async_save.await_count == 2
+
+
+def test_history_keeps_most_recent_entries(state_manager):
+    """Test that history is capped at the configured number of entries."""
+    for value in range(state_manager._max_history_entries + 5):
+        state_manager.record_entity_state("sensor.usage", str(value), {})
+
+    history = state_manager._state_history["sensor.usage"]
+    assert len(history) == state_manager._max_history_entries
+    assert history[0].state == "5"
+    assert history[-1].state == str(state_manager._max_history_entries + 4)
+
+
+@pytest.mark.asyncio
+async def test_history_round_trips_through_storage(state_manager):
+    """Test that history entries are stored as arrays and loaded back as capped deques."""
+    state_manager._store.async_save = AsyncMock()
+    state_manager.record_entity_state("sensor.usage", "12.5", {})
+    await state_manager.async_save_states()
+
+    saved = json_loads(json_bytes(state_manager._store.async_save.await_args.args[0]))
+    history = saved["state_history"]["sensor.usage"]
+    assert isinstance(history[0], list)
+
+    state_manager._store.async_load = AsyncMock(return_value=saved)
+    await state_manager.async_load_states()
+
+    history = state_manager._state_history["sensor.usage"]
+    assert history.maxlen == state_manager._max_history_entries
+    assert history[0].state == "12.5"
+
+
+@pytest.mark.asyncio
+async def test_restore_entity_states(state_manager):
+    """Test that only fresh saved states are restored."""
+    state_manager.record_entity_state("sensor.fresh", "5", {"icon": "mdi:flash"})
+    state_manager._entity_states["sensor.stale"] = {
+        "state": "6",
+        "attributes": {},
+        "last_updated": (dt_util.utcnow() - timedelta(days=8)).isoformat(),
+    }
+
+    results = await state_manager.async_restore_entity_states(
+        ["sensor.fresh", "sensor.stale", "sensor.missing"]
+    )
+
+    assert results == {"sensor.fresh": True, "sensor.stale": False, "sensor.missing": False}
+    state_manager.hass.states.async_set.assert_called_once_with(
+        "sensor.fresh", "5", {"icon": "mdi:flash"}
+    )